@@ -7,19 +7,23 @@ class BST:
         self.data = data
 
     def insertVal(self, data):
-        if self.data:
-            if data<self.data:
-                if self.left is None:
-                    self.left = BST(data)
-                else:
-                    self.left.insertVal(data)
-            elif data>self.data:
-                if self.right is None:
-                    self.right = BST(data)
-                else:
-                    self.right.insertVal(data)
-        else:
+        if not self.data:
             self.data = data
+            return
+        node = self
+        while True:
+            if data<node.data:
+                if node.left is None:
+                    node.left = BST(data)
+                    return
+                node = node.left
+            elif data>node.data:
+                if node.right is None:
+                    node.right = BST(data)
+                    return
+                node = node.right
+            else:
+                return
 
 
     def printTree(self):
@@ -30,19 +34,14 @@ class BST:
             self.right.printTree()
 
     def findValue(self,val):
-        if self.data==val:
-            print(f'{val} is found')
-            return True
-        elif val<self.data:
-            if self.left is None:
-                print(f'{val} is not found')
-                return False
-            self.left.findValue(val)
-        elif val>self.data:
-            if self.right is None:
-                print(f'{val} is not found')
-                return False
-            self.right.findValue(val)
+        node = self
+        while node is not None:
+            if node.data==val:
+                print(f'{val} is found')
+                return True
+            node = node.left if val<node.data else node.right
+        print(f'{val} is not found')
+        return False
             
 
 if __name__=='__main__':
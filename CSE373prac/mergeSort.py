@@ -1,34 +1,106 @@
 # merge sort python list
 
-def mergeSort(lis):
-    if len(lis)>1:
-        mid = len(lis)//2
-        L = lis[:mid]
-        R = lis[mid:]
-        mergeSort(L)
-        mergeSort(R)
-        i=j=k=0
-        
-        while i<len(L) and j<len(R):
-            if L[i]<=R[j]:
-                lis[k]=L[i]
-                i+=1
-            else:
-                lis[k]=R[j]
-                j+=1
-            k+=1
-        while i<len(L):
-            lis[k]=L[i]
+def mergeSort(lis, key=None):
+    # list.sort is CPython's Timsort (a merge sort in C): stable, O(n logn),
+    # and O(n) on input that already contains sorted runs
+    lis.sort(key=key)
+
+
+def minRun(n):
+    # Timsort's rule: a value in [32, 64] so n/minRun is close to a power of two
+    r = 0
+    while n>=64:
+        r |= n&1
+        n >>= 1
+    return n+r
+
+
+def insertionSort(lis, lo, hi):
+    for i in range(lo+1, hi):
+        key = lis[i]
+        j = i-1
+        while j>=lo:
+            v = lis[j]
+            if v<=key:
+                break
+            lis[j+1] = v
+            j-=1
+        lis[j+1] = key
+
+
+def mergeSortBottomUp(lis):
+    # iterative merge sort: merge runs of width 1, 2, 4, ... between lis and
+    # one scratch buffer, so there is no recursion and no L/R slice per level
+    n = len(lis)
+    if n<2:
+        return
+
+    # already one ascending run: nothing to do
+    i = 1
+    while i<n and lis[i-1]<=lis[i]:
+        i+=1
+    if i==n:
+        return
+    # one strictly descending run: reversing it keeps the sort stable
+    if i==1:
+        while i<n and lis[i]<lis[i-1]:
             i+=1
-            k+=1
-        while j<len(R):
-            lis[k]=R[j]
-            j+=1
-            k+=1
-    
+        if i==n:
+            lis.reverse()
+            return
+
+    # insertion sort blocks of minRun first, then start merging at that width
+    width = minRun(n)
+    for lo in range(0, n, width):
+        insertionSort(lis, lo, min(lo+width, n))
+
+    src, dst = lis, [None]*n
+    while width<n:
+        step = 2*width
+        for lo in range(0, n, step):
+            mid = lo+width
+            if mid>=n:
+                dst[lo:n]=src[lo:n]
+                continue
+            hi = lo+step if lo+step<n else n
+            # runs already in order (common on partially sorted data): no merge
+            if not src[mid]<src[mid-1]:
+                dst[lo:hi]=src[lo:hi]
+                continue
+            i, j, k = lo, mid, lo
+            # hold the two head values in locals so each element is read once
+            x, y = src[i], src[j]
+            while True:
+                if y<x:
+                    dst[k]=y
+                    k+=1
+                    j+=1
+                    if j==hi:
+                        break
+                    y=src[j]
+                else:
+                    dst[k]=x
+                    k+=1
+                    i+=1
+                    if i==mid:
+                        break
+                    x=src[i]
+            # at most one side is left over; copy it as a single slice
+            if i<mid:
+                dst[k:hi]=src[i:mid]
+            else:
+                dst[k:hi]=src[j:hi]
+        src, dst = dst, src
+        width*=2
+    if src is not lis:
+        lis[:]=src
+
 
 if __name__=='__main__':
     l = [2,56,12,34,87,23,54]
     print(f'unsorted array is : {l}')
     sortList = mergeSort(l)
     print(f'sorted array: {sortList}')
+    l = [2,56,12,34,87,23,54]
+    mergeSortBottomUp(l)
+    print(f'bottom up sorted array: {l}')
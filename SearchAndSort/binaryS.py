@@ -1,25 +1,20 @@
 #only use for sorted array
-def binarysearch(arr, l, r, x):
-	if r>=l:
-		mid = l+(r-l)//2
-		if arr[mid]==x:
-			return mid
-
-		elif arr[mid]>x:
-			return binarysearch(arr, l, mid-1, x)
+from bisect import bisect_left
 
-		else:
-			return binarysearch(arr, mid+1, r, x)
-	else:
-		return -1
+def binarysearch(arr, x):
+	i = bisect_left(arr, x)
+	if i<len(arr) and arr[i]==x:
+		return i
+	return -1
 
 def iterative(arr, l, r, x):
 	while l<=r:
 		mid = l+(r-l)//2
+		v = arr[mid]
 
-		if arr[mid]==x:
+		if v==x:
 			return mid
-		elif arr[mid]<x:
+		elif v<x:
 			l = mid+1
 		else:
 			r = mid-1
@@ -1,13 +1,54 @@
 #time complexity O(n*n), space complexity constant
+from array import array
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 def insersionSort(arr):
     for i in range(1,len(arr)):
         key = arr[i]
         j = i-1
 
-        while j>=0 and arr[j]>key:
-            arr[j+1] = arr[j]
+        # read each shifted element once
+        while j>=0:
+            v = arr[j]
+            if v<=key:
+                break
+            arr[j+1] = v
             j-=1
         arr[j+1]=key
     return arr
 
+# numeric input: contiguous int64 storage instead of boxed list slots
+def insertion_sort_typed(arr):
+    a = array('q', arr)
+    for i in range(1,len(a)):
+        key = a[i]
+        j = i-1
+
+        while j>=0:
+            v = a[j]
+            if v<=key:
+                break
+            a[j+1] = v
+            j-=1
+        a[j+1] = key
+    return a
+
+if njit is not None:
+    # same loop compiled to native code, sorts a numpy array in place
+    @njit(cache=True)
+    def insertion_sort_nb(a):
+        for i in range(1,a.shape[0]):
+            key = a[i]
+            j = i-1
+
+            while j>=0 and a[j]>key:
+                a[j+1] = a[j]
+                j-=1
+            a[j+1]=key
+        return a
+
 print(insersionSort([5,2,6,7,1,0]))
+print(insertion_sort_typed([5,2,6,7,1,0]).tolist())
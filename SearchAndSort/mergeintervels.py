@@ -1,15 +1,19 @@
+from operator import itemgetter
+
 def merge(arr):
-    res = []
-    j = 0
-    arr.sort(key = lambda x: x[0])
-    res.append(arr[0])
+    if not arr:
+        return []
+    arr.sort(key = itemgetter(0))
+    res = [list(arr[0])]
 
-    for i in range(1, len(arr)):
-        if arr[j][1]>=arr[i][0]:
-            res[-1][1]= max(res[-1][1], arr[i][1])
+    # only the last merged interval can overlap the next one
+    for s, e in arr[1:]:
+        last = res[-1]
+        if s<=last[1]:
+            last[1] = max(last[1], e)
         else:
-            res.append(arr[i])
-            j=i
+            res.append([s, e])
     return res
 
-print(merge([[1,4],[0,4]]))
\ No newline at end of file
+print(merge([[1,4],[0,4]]))
+print(merge([[1,3],[2,6],[8,10],[9,12],[11,15]]))
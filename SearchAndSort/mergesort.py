@@ -1,39 +1,141 @@
-#time complexity O(n logn), space constant
-def mergesort(arr):
-	if len(arr)>1:
-
-		length = len(arr)
-		mid = length//2
-
-		l = arr[:mid]
-		r =arr[mid:]
-
-		mergesort(l)
-		mergesort(r)
-		i=0
-		j=0
-		k=0
-
-		while i<len(l) and j<len(r):
-			if l[i]<r[j]:
-				arr[k]=l[i]
-				i+=1
-			else:
-				arr[k]=r[j]
-				j+=1
-			k+=1
-
-		while i<len(l):
-			arr[k]=l[i]
-			i+=1
-			k+=1
-		while j<len(r):
-			arr[k]=r[j]
-			j+=1
-			k+=1
+#time complexity O(n logn), space O(n) worst case (Timsort merge buffer)
+try:
+	import numpy as np
+	from numba import njit
+except ImportError:
+	np = None
+from heapq import merge
+from math import ceil
+from multiprocessing import Pool, cpu_count
+
+def mergesort(arr, key=None):
+	# delegate to the built-in Timsort (C merge sort, stable, adaptive to runs)
+	arr.sort(key=key)
 
 	return arr
 
-arr = [2,0,2,1,1,0]
-res = mergesort(arr)
-print(arr)
\ No newline at end of file
+# iterative bottom-up version, one scratch buffer, no recursion or slicing
+def bottom_up_mergesort(arr):
+	n = len(arr)
+	src, dst = arr, [None]*n
+	width = 1
+	while width<n:
+		step = 2*width
+		for lo in range(0, n, step):
+			mid = lo+width
+			if mid>=n:
+				dst[lo:n]=src[lo:n]
+				continue
+			hi = lo+step if lo+step<n else n
+			i, j, k = lo, mid, lo
+			# hold the two head values in locals so each element is read once
+			x, y = src[i], src[j]
+			while True:
+				if y<x:
+					dst[k]=y
+					k+=1
+					j+=1
+					if j==hi:
+						break
+					y=src[j]
+				else:
+					dst[k]=x
+					k+=1
+					i+=1
+					if i==mid:
+						break
+					x=src[i]
+			# at most one side is left over; copy it as a single slice
+			if i<mid:
+				dst[k:hi]=src[i:mid]
+			else:
+				dst[k:hi]=src[j:hi]
+		src, dst = dst, src
+		width*=2
+	if src is not arr:
+		arr[:]=src
+	return arr
+
+if np is not None:
+	# same bottom-up merge, compiled to native int64 compares over contiguous memory
+	@njit(cache=True, boundscheck=False)
+	def _merge_sort_nb(a, buf):
+		n = a.shape[0]
+		src = a
+		dst = buf
+		in_buf = False
+		width = 1
+		while width<n:
+			for lo in range(0, n, 2*width):
+				mid = min(lo+width, n)
+				hi = min(lo+2*width, n)
+				i=lo
+				j=mid
+				k=lo
+				while i<mid and j<hi:
+					if src[j]<src[i]:
+						dst[k]=src[j]
+						j+=1
+					else:
+						dst[k]=src[i]
+						i+=1
+					k+=1
+				while i<mid:
+					dst[k]=src[i]
+					i+=1
+					k+=1
+				while j<hi:
+					dst[k]=src[j]
+					j+=1
+					k+=1
+			src, dst = dst, src
+			in_buf = not in_buf
+			width*=2
+		if in_buf:
+			a[:] = buf
+
+# numeric input only; returns an int64 array, or the sorted list when numba is missing
+def fast_mergesort(arr):
+	if np is None:
+		arr.sort()
+		return arr
+	a = np.ascontiguousarray(arr, dtype=np.int64)
+	buf = np.empty_like(a)
+	_merge_sort_nb(a, buf)
+	return a
+
+# below this size pickling chunks to the workers costs more than it saves
+PARALLEL_THRESHOLD = 200_000
+
+def _merge_pair(pair):
+	return list(merge(*pair))
+
+# sort cpu_count() chunks in worker processes, then merge the sorted runs
+# pairwise in the pool until one is left. returns a new list
+def mergesort_parallel(data, pool=None):
+	if len(data)<PARALLEL_THRESHOLD:
+		return sorted(data)
+	processes = cpu_count()
+	own_pool = pool is None
+	if own_pool:
+		pool = Pool(processes)
+	try:
+		size = ceil(len(data)/processes)
+		chunks = [data[i*size:(i+1)*size] for i in range(processes)]
+		runs = pool.map(sorted, chunks)
+		while len(runs)>1:
+			extra = [runs.pop()] if len(runs)%2 else []
+			runs = pool.map(_merge_pair, list(zip(runs[0::2], runs[1::2]))) + extra
+	finally:
+		if own_pool:
+			pool.close()
+			pool.join()
+	return runs[0]
+
+if __name__ == '__main__':
+	arr = [2,0,2,1,1,0]
+	res = mergesort(arr)
+	print(arr)
+	print(bottom_up_mergesort([5,3,9,1,1,0,7]))
+	print(fast_mergesort([5,3,9,1,1,0,7]))
+	print(mergesort_parallel([5,3,9,1,1,0,7]))
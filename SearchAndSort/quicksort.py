@@ -1,21 +1,90 @@
-#time complexity O(n logn), space logn
+#introsort: in-place quicksort that falls back to heapsort when recursion gets too deep
+#time complexity O(n logn) worst case, space O(logn)
+import math
+
+SMALL = 16
+
 def quicksort(array):
-    less=[]
-    equal=[]
-    greter=[]
-    
     if len(array)>1:
-        pivot=array[0]
-        for x in array:
-            if x<pivot:
-                less.append(x)
-            elif x==pivot:
-                equal.append(x)
-            elif x>pivot:
-                greter.append(x)
-        return quicksort(less) + equal + quicksort(greter)
-    else:
-        return array
+        _introsort(array, 0, len(array)-1, 2*int(math.log2(len(array))))
+    return array
+
+def _introsort(a, lo, hi, depth):
+    while hi-lo+1>SMALL:
+        if depth==0:
+            _heapsort(a, lo, hi)
+            return
+        depth-=1
+
+        #median of three as pivot, so sorted and reversed input stay O(n logn)
+        mid = lo+(hi-lo)//2
+        x, y, z = a[lo], a[mid], a[hi]
+        if x>y:
+            x, y = y, x
+        if y>z:
+            y = z if x<=z else x
+        pivot = y
+
+        #three-way (dutch flag) partition: a[lo:lt] < pivot, a[lt:gt+1] == pivot, a[gt+1:hi+1] > pivot
+        lt, i, gt = lo, lo, hi
+        while i<=gt:
+            v = a[i]
+            if v<pivot:
+                a[lt], a[i] = v, a[lt]
+                lt+=1
+                i+=1
+            elif v>pivot:
+                a[gt], a[i] = v, a[gt]
+                gt-=1
+            else:
+                i+=1
+
+        #recurse on the smaller side, loop on the larger one
+        if lt-lo<hi-gt:
+            _introsort(a, lo, lt-1, depth)
+            lo = gt+1
+        else:
+            _introsort(a, gt+1, hi, depth)
+            hi = lt-1
+    _insertionsort(a, lo, hi)
+
+def _insertionsort(a, lo, hi):
+    for i in range(lo+1, hi+1):
+        key = a[i]
+        j = i-1
+        while j>=lo:
+            v = a[j]
+            if v<=key:
+                break
+            a[j+1] = v
+            j-=1
+        a[j+1] = key
+
+def _heapsort(a, lo, hi):
+    n = hi-lo+1
+    for i in range(n//2-1, -1, -1):
+        _siftdown(a, lo, i, n)
+    for end in range(n-1, 0, -1):
+        a[lo], a[lo+end] = a[lo+end], a[lo]
+        _siftdown(a, lo, 0, end)
+
+def _siftdown(a, lo, i, n):
+    #max-heap over a[lo:lo+n], i is relative to lo
+    root = a[lo+i]
+    child = 2*i+1
+    while child<n:
+        c = lo+child
+        v = a[c]
+        if child+1<n and v<a[c+1]:
+            c+=1
+            child+=1
+            v = a[c]
+        if v<=root:
+            break
+        a[lo+i] = v
+        i = child
+        child = 2*i+1
+    a[lo+i] = root
 
 test = [21, 4, 1, 3, 9, 20, 25, 6, 21, 14]
-print(quicksort(test))
\ No newline at end of file
+print(quicksort(test))
@@ -1,15 +1,10 @@
+from bisect import bisect_left
+
 
 def binartSearch(arr, x):
-    left = 0
-    right = len(arr)-1
-    while left <= right:
-        mid = left + (right-left)//2
-        if arr[mid]==x:
-            return mid
-        elif arr[mid]<x:
-            left=mid+1
-        else:
-            right=mid-1
+    i = bisect_left(arr, x)
+    if i<len(arr) and arr[i]==x:
+        return i
     return -1
 x=9
 search = binartSearch([2,3,5,7,9],x)
@@ -4,11 +4,13 @@ def findMin(nums):
     r=len(nums)-1
 
     while l<=r:
-        if nums[l]<=nums[r]:
-            return nums[l]
+        left = nums[l]
+        right = nums[r]
+        if left<=right:
+            return left
         mid = l+(r-l)//2
 
-        if nums[r]<nums[mid]:
+        if right<nums[mid]:
             l=mid+1
         else:
             r=mid
@@ -1,7 +1,11 @@
 #piles [3,6,7,11] h=8
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #bruit force solution
-import math
 def kokoEating(nums, h):
     mx = max(nums)
     for speed in range(1, mx+1):
@@ -16,16 +20,18 @@ def kokoEating(nums, h):
     return mx
 #print(kokoEating([3,6,7,11], 8))
 #binary search
-import math
 def kokoEatingBinary(nums,h):
+    piles = np.asarray(nums, dtype=np.int64) if np is not None else nums
     l = 1
     r = max(nums)
     res = r
     while l<=r:
         speed = l + (r-l)//2
-        time = 0
-        for banana in nums:
-            time+= math.ceil(banana/speed)
+        #integer ceil division, vectorized when numpy is available
+        if np is not None:
+            time = int(((piles + speed - 1)//speed).sum())
+        else:
+            time = sum((banana + speed - 1)//speed for banana in piles)
         if time<=h:
             r = speed-1
             res = min(speed,res)
@@ -33,5 +39,6 @@ def kokoEatingBinary(nums,h):
             l = speed+1
     return res
 print(kokoEating([3,6,7,11], 8))
+print(kokoEatingBinary([3,6,7,11], 8))
 
 
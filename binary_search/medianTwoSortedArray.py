@@ -1,6 +1,20 @@
 #broot force
 import math
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def medianOfTwoSortedArray(nums1, nums2):
+    if np is not None:
+        #introselect puts the middle element in place in O(m+n), no full sort
+        c = np.concatenate([np.asarray(nums1), np.asarray(nums2)])
+        l = c.size
+        mid = l//2
+        p = np.partition(c, mid)
+        if l%2 !=0:
+            return p[mid].item()
+        return (p[:mid].max() + p[mid]).item()/2
     merged = nums1 + nums2
     merged.sort()
     l = len(merged)
@@ -11,31 +25,26 @@ def medianOfTwoSortedArray(nums1, nums2):
         return (merged[mid-1] + merged[mid])/2
 print(medianOfTwoSortedArray([1,2,5,6], [4,7,3,9]))
 
-#optimal
-def findMedianSortedArrays(nums1, nums2):
-    mergedArr = []
+#two pointer, O(m+n) time and O(1) space: walk the merge order only up to
+#the middle and keep the last two values instead of building the merged array
+def findMedianSortedArraysLinear(nums1, nums2):
     l1 = len(nums1)
     l2 = len(nums2)
+    half = (l1+l2)//2
     i = j = 0
-    while i<l1 and j<l2:
-        if nums1[i]<nums2[j]:
-            mergedArr.append(nums1[i])
+    prev = cur = 0
+    for _ in range(half+1):
+        prev = cur
+        if j>=l2 or (i<l1 and nums1[i]<nums2[j]):
+            cur = nums1[i]
             i+=1
         else:
-            mergedArr.append(nums2[j])
+            cur = nums2[j]
             j+=1
-    while l1>i:
-        mergedArr.append(nums1[i])
-        i+=1
-    while l2>j:
-        mergedArr.append(nums2[j])
-        j+=1
-    l = len(mergedArr)
-    mid = l//2
-    if l%2 !=0:
-        return mergedArr[mid]
+    if (l1+l2)%2 !=0:
+        return cur
     else:
-        return (mergedArr[mid-1] + mergedArr[mid])/2
+        return (prev + cur)/2
     
 # O(log(m+n))
 def findMedianSortedArrays(nums1, nums2):
@@ -5,16 +5,17 @@ def search(nums, target):
 
     while l<=r:
         mid = l+(r-l)//2
+        m = nums[mid]
 
-        if nums[mid]==target:
+        if m==target:
             return mid
-        if nums[l]<=nums[mid]:
-            if target>=nums[l] and target<nums[mid]:
+        if nums[l]<=m:
+            if nums[l]<=target<m:
                 r= mid-1
             else:
                 l=mid+1
         else:
-            if target>nums[mid] and target<= nums[r]:
+            if m<target<=nums[r]:
                 l=mid+1
             else:
                 r=mid-1
@@ -1,27 +1,32 @@
 # implement graph algorithm
+from collections import deque
 
 class Graph:
     def __init__(self, routes):
         self.routes = routes
 
-    def find_fath(self, start, end, path=[]):
-        path = path + [start]
-
-        if start==end:
-            return [path]
-        if start not in self.routes.keys():
-            return None
-        paths =[]
-
-        for node in self.routes[start]:
-            if node not in path:
-                newpaths = self.find_fath(node,end,path)
-
-                for newpath in newpaths:
-                    paths.append(newpath)
+    # iterative BFS over (node, path) pairs; paths are tuples so extending one
+    # never copies a list, and paths come out shortest first.
+    # early_exit stops at the first (shortest) path found
+    def find_path(self, start, end, early_exit=False):
+        q = deque([(start, (start,))])
+        paths = []
+
+        while q:
+            node, path = q.popleft()
+            if node==end:
+                paths.append(list(path))
+                if early_exit:
+                    break
+                continue
+            for nxt in self.routes.get(node, ()):
+                if nxt not in path:
+                    q.append((nxt, path + (nxt,)))
 
         return paths
 
+    find_fath = find_path
+
 
 if __name__=="__main__":
 
@@ -33,4 +38,5 @@ if __name__=="__main__":
              'F': ['C']
              }
     graph = Graph(routes)
-    print(graph.find_fath('A','D'))
\ No newline at end of file
+    print(graph.find_fath('A','D'))
+    print(graph.find_path('A','D', early_exit=True))
\ No newline at end of file
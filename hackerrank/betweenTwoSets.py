@@ -1,33 +1,26 @@
-
 from math import gcd 
 from functools import reduce # Python version 3.x
 def lcm(denominators):
     return reduce(lambda a,b: a*b // gcd(a,b), denominators)
     
-def factors(lst):
-    output = []
-    for i in range(1, min(lst) + 1):
-        if all(x % i == 0 for x in lst):
-            output.append(i)
-    return output
 def getTotalX(a, b):
     # Write your code here
-    x = lcm(a)
-    fac = []
-    v = 0
-    i=0
-    while v<max(b):
-        v = x*i
-        fac.append(v)
-        i+=1
-    factor = factors(b)
-    seta = set(fac)
-    setb = set(factor)
-    if seta & setb:
-        return len(seta & setb)
-    else:
+    # x is "between" a and b iff lcm(a) divides x and x divides gcd(b),
+    # so count the multiples of lcm(a) that divide gcd(b). l*m divides g
+    # iff m divides q = g//l: count the divisors of q in pairs (i, q//i)
+    l = lcm(a)
+    g = reduce(gcd, b)
+    if g % l:
         return 0
+    q = g // l
+    count = 0
+    i = 1
+    while i*i<=q:
+        if q % i == 0:
+            count += 1 if i*i==q else 2
+        i+=1
+    return count
     
 if __name__=='__main__':
     x = getTotalX([2,6],[24,36])
-    print(x)
\ No newline at end of file
+    print(x)
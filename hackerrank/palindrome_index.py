@@ -1,19 +1,21 @@
 
 def palindromeIndex(s):
-    if s == s[::-1]:
+    l, r = 0, len(s)-1
+    while l<r and s[l]==s[r]:
+        l += 1
+        r -= 1
+    if l>=r:
         return -1
-    
-    ind = 0
-    l = len(s)
-    
-    while ind<len(s)//2:
-        if s[ind] != s[l-ind-1]:
-            if s[ind+1]==s[l-ind-1] and s[ind+2]==s[l-ind-2]:
-                return ind
-            else:
-                return l-ind-1
-        ind +=1
-        
+
+    # first mismatch: one of the two ends has to go, the rest in between must read the same both ways
+    skip_left = s[l+1:r+1]
+    if skip_left == skip_left[::-1]:
+        return l
+    skip_right = s[l:r]
+    if skip_right == skip_right[::-1]:
+        return r
+    return -1
+
 if __name__=='__main__':
     x = palindromeIndex('bcbc')
-    print(x)
\ No newline at end of file
+    print(x)
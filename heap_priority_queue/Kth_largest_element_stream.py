@@ -2,17 +2,20 @@ import heapq
 class KthLargest:
     def __init__(self, k: int, nums: list[int]):
         self.k = k
-        self.min_heap = []
-        for num in nums:
-            heapq.heappush(self.min_heap, num)
-            if len(self.min_heap) > k:
-                heapq.heappop(self.min_heap)
+        self.min_heap = nums[:k]
+        heapq.heapify(self.min_heap)
+        for num in nums[k:]:
+            # push and pop in one sift instead of two
+            heapq.heappushpop(self.min_heap, num)
 
     def add(self, val: int) -> int:
-        heapq.heappush(self.min_heap, val)
-        if len(self.min_heap) > self.k:
-            heapq.heappop(self.min_heap)
-        return self.min_heap[0]
+        h = self.min_heap
+        if len(h) < self.k:
+            heapq.heappush(h, val)
+        elif val > h[0]:
+            # heap is full and val beats the current kth largest: replace the root
+            heapq.heapreplace(h, val)
+        return h[0]
 # Example usage:
 kthLargest = KthLargest(3, [4, 5, 8, 2])
 print(kthLargest.add(3))  # returns 4
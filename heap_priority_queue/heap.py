@@ -1,11 +1,18 @@
 # Heap is a complete binary data structure.
 from heapq import heappush, heappop, heapify
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+# heapq backed heap, works for any comparable payload
 class Heap:
     def __init__(self):
         self.heap = []
 
     def parent(self, i):
-        return (i-1)/2
+        return (i-1)//2
     
     def insertKey(self, key):
         heappush(self.heap, key)
@@ -15,6 +22,7 @@ class Heap:
 
         while i !=0 and self.heap[self.parent(i)]>self.heap[i]:
             self.heap[i], self.heap[self.parent(i)]= self.heap[self.parent(i)], self.heap[i]
+            i = self.parent(i)
 
     def extractMin(self):
         return heappop(self.heap)
@@ -29,9 +37,80 @@ class Heap:
     def printHeap(self):
         print(self.heap)
         return
+
+if np is not None:
+    @njit(cache=True)
+    def _sift_up(a, i):
+        item = a[i]
+        while i>0:
+            p = (i-1)>>1
+            if a[p]<=item:
+                break
+            a[i] = a[p]
+            i = p
+        a[i] = item
+
+    @njit(cache=True)
+    def _sift_down(a, n, i):
+        item = a[i]
+        child = 2*i+1
+        while child<n:
+            if child+1<n and a[child+1]<a[child]:
+                child+=1
+            if item<=a[child]:
+                break
+            a[i] = a[child]
+            i = child
+            child = 2*i+1
+        a[i] = item
+
+    # int64 only heap on a preallocated numpy buffer, sift loops compiled by numba
+    class IntHeap:
+        def __init__(self, init_cap=16):
+            self.data = np.empty(init_cap, dtype=np.int64)
+            self.n = 0
+
+        def parent(self, i):
+            return (i-1)>>1
+
+        def insertKey(self, key):
+            if self.n==self.data.shape[0]:
+                self.data = np.resize(self.data, max(1, 2*self.n))
+            self.data[self.n] = key
+            self.n+=1
+            _sift_up(self.data, self.n-1)
+
+        def decreaseKey(self, i, new_val):
+            if not 0<=i<self.n:
+                raise IndexError('heap index out of range')
+            self.data[i] = new_val
+            _sift_up(self.data, i)
+
+        def extractMin(self):
+            if self.n==0:
+                raise IndexError('extract from empty heap')
+            root = int(self.data[0])
+            self.n-=1
+            if self.n:
+                self.data[0] = self.data[self.n]
+                _sift_down(self.data, self.n, 0)
+            return root
+
+        def deleteKey(self, i):
+            self.decreaseKey(i, np.iinfo(np.int64).min)
+            self.extractMin()
+
+        def getMin(self):
+            if self.n==0:
+                raise IndexError('heap is empty')
+            return int(self.data[0])
+
+        def printHeap(self):
+            print(self.data[:self.n].tolist())
+            return
     
 if __name__=="__main__":
-    heapObj = Heap()
+    heapObj = IntHeap() if np is not None else Heap()
     heapObj.insertKey(3)
     heapObj.insertKey(2)
     heapObj.deleteKey(1)
@@ -43,4 +122,4 @@ if __name__=="__main__":
     heapObj.printHeap()
 
 
-    
\ No newline at end of file
+    
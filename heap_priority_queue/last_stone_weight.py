@@ -6,13 +6,15 @@ def lastStoneWeight(stones):
     heapq.heapify(max_heap)
 
     while len(max_heap) > 1:
-        # Pop the two heaviest stones
+        # Pop the heaviest stone and peek at the second heaviest
         first = -heapq.heappop(max_heap)
-        second = -heapq.heappop(max_heap)
+        second = -max_heap[0]
 
-        if first != second:
-            # If they are not equal, push the difference back into the heap
-            heapq.heappush(max_heap, -(first - second))
+        if first == second:
+            heapq.heappop(max_heap)
+        else:
+            # Replace the second stone with the difference in one sift
+            heapq.heapreplace(max_heap, -(first - second))
 
     # If there's a stone left, return its weight, otherwise return 0
     return -max_heap[0] if max_heap else 0
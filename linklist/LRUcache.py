@@ -1,23 +1,56 @@
-from collections import OrderedDict
+# dict of key -> node plus a doubly linked list with head/tail sentinels:
+# most recent entry sits right after head, the eviction victim right before tail
+class Node:
+    __slots__ = ('key', 'val', 'prev', 'next')
+
+    def __init__(self, key=None, val=None):
+        self.key = key
+        self.val = val
+        self.prev = None
+        self.next = None
+
 class LRUcache:
     def __init__(self, capacity):
         self.capacity = capacity
-        self.cache = OrderedDict()
+        self.cache = {}
+        self.head = Node()
+        self.tail = Node()
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _push_front(self, node):
+        first = self.head.next
+        node.prev = self.head
+        node.next = first
+        first.prev = node
+        self.head.next = node
 
     def get(self, key):
-        if key not in self.cache:
+        node = self.cache.get(key)
+        if node is None:
             return -1
-        self.cache.move_to_end(key)
-        return self.cache.get(key)
+        self._unlink(node)
+        self._push_front(node)
+        return node.val
     
     def put(self, key, val):
-        if key in self.cache:
-            self.cache[key] = val
-            self.cache.move_to_end(key)
-        else:
-            if len(self.cache)>=self.capacity:
-                self.cache.popitem(last=False)
-            self.cache[key] = val
+        node = self.cache.get(key)
+        if node is not None:
+            node.val = val
+            self._unlink(node)
+            self._push_front(node)
+            return
+        if len(self.cache)>=self.capacity:
+            lru = self.tail.prev
+            self._unlink(lru)
+            del self.cache[lru.key]
+        node = Node(key, val)
+        self.cache[key] = node
+        self._push_front(node)
 
 cache = LRUcache(5)
 cache.put(1,1)
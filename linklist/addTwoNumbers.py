@@ -1,36 +1,51 @@
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next=next
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown (e.g. head was assigned directly)
+        self.tail = None
 
     def insertAtBegining(self, data):
         node = Node(data, self.head)
+        if self.head is None:
+            self.tail = node
         self.head = node
         return node
     def insertAtEnd(self, data):
-        node =Node(data)
+        node = Node(data)
         if self.head == None:
-            self.head=node
+            self.head=self.tail=node
             return
         
-        itr = self.head
-        while itr.next:
-            itr=itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr=itr.next
         itr.next=node
+        self.tail=node
         return
 def printList(l):
     head = l.head
     if l.head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 def addTwoList(l1,l2):
     res = r = Node()
     carry = 0
@@ -51,6 +66,60 @@ def addTwoList(l1,l2):
     res_list.head = res.next
     return res_list
 
+def iterDigits(head):
+    while head:
+        yield head.data
+        head = head.next
+
+# same sum without the per-digit "if l else 0" checks: read both lists into
+# zero padded bytearrays, then the carry comes from (s>=10) arithmetic
+def addTwoListPacked(l1,l2):
+    A = bytearray(iterDigits(l1))
+    B = bytearray(iterDigits(l2))
+    n = max(len(A), len(B))
+    A.extend(bytes(n-len(A)))
+    B.extend(bytes(n-len(B)))
+    out = bytearray(n+1)
+    carry = 0
+    for i in range(n):
+        v = A[i]+B[i]+carry
+        carry = v>=10
+        out[i] = v-carry*10
+    out[n] = carry
+    res_list = Linklist()
+    for digit in reversed(out if carry else out[:n]):
+        res_list.insertAtBegining(digit)
+    return res_list
+
+if np is not None:
+    @njit(cache=True)
+    def _propagateCarry(total):
+        carry = 0
+        for i in range(total.shape[0]):
+            v = total[i] + carry
+            carry = v//10
+            total[i] = v - carry*10
+        return total
+
+# same sum over flat int8 digit arrays: walk each list once, add the arrays,
+# one compiled carry pass, then build the result list only at the end
+def addTwoListArray(l1,l2):
+    if np is None:
+        return addTwoList(l1,l2)
+    a = np.fromiter(iterDigits(l1), dtype=np.int8)
+    b = np.fromiter(iterDigits(l2), dtype=np.int8)
+    n = max(a.size, b.size)
+    total = np.zeros(n+1, dtype=np.int8)
+    total[:a.size] += a
+    total[:b.size] += b
+    _propagateCarry(total)
+    if total[n]==0:
+        total = total[:n]
+    res_list = Linklist()
+    for digit in total[::-1].tolist():
+        res_list.insertAtBegining(digit)
+    return res_list
+
 l1 = Linklist()
 l1.insertAtEnd(4)
 l1.insertAtEnd(3)
@@ -65,4 +134,6 @@ l2.insertAtEnd(4)
 print(f'list 1: {printList(l1)}')
 print(f'list 2 : {printList(l2)}')
 
-print(f'sum of  two linklist: {printList(addTwoList(l1.head,l2.head))}')
\ No newline at end of file
+print(f'sum of  two linklist: {printList(addTwoList(l1.head,l2.head))}')
+print(f'sum of  two linklist (array): {printList(addTwoListArray(l1.head,l2.head))}')
+print(f'sum of  two linklist (packed): {printList(addTwoListPacked(l1.head,l2.head))}')
\ No newline at end of file
@@ -1,35 +1,44 @@
 class Node:
+    __slots__ = ('data', 'next', 'random')
+
     def __init__(self, data=None, next=None, random = None):
         self.data = data
         self.next=next
         self.random = random
 def copyListWithRandomPointer(head):
-    dic = {None:None}
+    # weave each copy right after its original (A->A'->B->B'...), so the copy
+    # of x.random is x.random.next and no node -> copy dict is needed
     h = head
     while h:
-        copy = Node(h.data)
-        dic[h] = copy
-        h = h.next
+        h.next = Node(h.data, h.next)
+        h = h.next.next
     h = head
     while h:
-        copy = dic[h]
-        copy.next = dic[h.next]
-        copy.random = dic[h.random]
-        h =h.next
-    return dic[head]
+        if h.random:
+            h.next.random = h.random.next
+        h = h.next.next
+    # unweave: restore the original next pointers and chain the copies
+    copy_head = head.next if head else None
+    h = head
+    while h:
+        copy = h.next
+        h.next = copy.next
+        copy.next = copy.next.next if copy.next else None
+        h = h.next
+    return copy_head
 
 def printList(l):
     head = l
     if head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         if head.random:
-            list_str += str(head.random.data)+ " (random)--->"
+            parts.append(str(head.random.data)+ " (random)--->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 
 
 N1 = Node(1)
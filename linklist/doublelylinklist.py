@@ -1,4 +1,6 @@
 class Node():
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data=None, next=None, prev=None):
         self.data=data
         self.next=next
@@ -7,35 +9,38 @@ class Node():
 class linklist():
     def __init__(self):
         self.head = None
+        self.tail = None
     def addbeg(self,data):
         node=Node(data=data, next=self.head)
 
         if self.head is not None:
             self.head.prev=node
+        else:
+            self.tail=node
         self.head=node
         return
     def addlast(self, data):
-        node = Node(data) 
-        itr = self.head
         if self.head==None:
             return self.addbeg(data)
 
-        while itr.next:
-            itr=itr.next
-        itr.next=node
-        node.prev=itr
+        node = Node(data, None, self.tail)
+        self.tail.next=node
+        self.tail=node
+    # insert after the pos-th node (1 based)
     def addpos(self, pos, data):
-        node= Node(data)
+        if pos<=0 or self.head is None:
+            return self.addbeg(data)
         itr = self.head
         count=1
-        while itr:
-            if count==pos:
-                break
+        while itr.next and count<pos:
             count+=1
             itr=itr.next
+        node= Node(data, itr.next, itr)
+        if itr.next is not None:
+            itr.next.prev=node
+        else:
+            self.tail=node
         itr.next = node
-        node.prev=itr.next 
-        node.next=itr.next.next.prev
         
         
     
@@ -45,16 +50,16 @@ class linklist():
             print('empty')
             return
         itr = self.head
-        res=''
+        parts=[]
         while itr:
-            res += str(itr.data) + '->'
+            parts.append(str(itr.data) + '->')
             itr=itr.next
-        print(res)
+        print(''.join(parts))
 l=linklist()
 l.addbeg(20)
 l.addbeg(30)
 l.addbeg(40)
 l.addlast(70)
 l.addlast(80)
-#l.addpos(1,90)
+l.addpos(1,90)
 l.printlist()
\ No newline at end of file
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next = next
@@ -6,9 +8,13 @@ class Node:
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown
+        self.tail = None
 
     def insertBegaining(self, data):
         new_node = Node(data, self.head)
+        if self.head is None:
+            self.tail = new_node
         self.head = new_node
         return
     
@@ -16,13 +22,16 @@ class Linklist:
         new_node = Node(data)
 
         if self.head==None:
-            self.head = new_node
+            self.head = self.tail = new_node
             return
         
-        itr = self.head
-        while itr.next:
-            itr = itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr = itr.next
         itr.next = new_node
+        self.tail = new_node
         return
     
     def insertAtPosition(self, data, pos):
@@ -76,13 +85,20 @@ class Linklist:
             print("invalid length")
             return
         if pos==0:
-            self.head = self.head.next
+            removed = self.head
+            self.head = removed.next
+            if removed is self.tail:
+                self.tail = None
+            return
 
         itr=self.head
         count=0
         while itr.next:
             if count==pos-1:
-                itr.next=itr.next.next
+                removed = itr.next
+                itr.next=removed.next
+                if removed is self.tail:
+                    self.tail = itr
                 return
             count+=1
             itr=itr.next
@@ -90,6 +106,7 @@ class Linklist:
     def reverse(self):
         prev = None
         itr = self.head
+        self.tail = itr
         while itr:
             next=itr.next
             itr.next=prev
@@ -103,12 +120,12 @@ class Linklist:
         if self.head == None:
             print('link list is empty')
             return
-        lis = ""
+        parts = []
         itr = self.head
         while itr:
-            lis += str(itr.data) + "-->"
+            parts.append(str(itr.data) + "-->")
             itr = itr.next
-        print(lis)
+        print(''.join(parts))
 
         return
     
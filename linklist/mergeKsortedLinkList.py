@@ -1,40 +1,63 @@
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+from heapq import heapify, heappop, heapreplace, merge
+
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next=next
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown (e.g. head was assigned directly)
+        self.tail = None
 
     def insertAtBegining(self, data):
         node = Node(data, self.head)
+        if self.head is None:
+            self.tail = node
         self.head = node
         return node
     def insertAtEnd(self, data):
-        node =Node(data)
+        node = Node(data)
         if self.head == None:
-            self.head=node
+            self.head=self.tail=node
             return
         
-        itr = self.head
-        while itr.next:
-            itr=itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr=itr.next
         itr.next=node
+        self.tail=node
         return
 def printList(l):
     head = l.head
     if l.head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 
 def mergeKLists(lists):
         if not lists or len(lists)==0:
             return None
+        # both ways are N log K. pairwise rounds relink every node once per
+        # round, the heap links each node once in a single pass with the
+        # compares inside heapq's C code, which pays off past a handful of lists
+        if len(lists)>16:
+            merged_list = Linklist()
+            merged_list.head = mergeKListsHeap(lists)
+            return merged_list
         while len(lists)>1:
             mergeList = []
             for i in range(0,len(lists),2):
@@ -46,6 +69,22 @@ def mergeKLists(lists):
         merged_list.head = lists[0]
         return merged_list
     
+def mergeKListsHeap(lists):
+    # (data, list index, node): the index breaks ties so nodes are never compared
+    heap = [(h.data, i, h) for i, h in enumerate(lists) if h]
+    heapify(heap)
+    dummy = Node()
+    tail = dummy
+    while heap:
+        _, i, node = heap[0]
+        tail.next = node
+        tail = node
+        if node.next:
+            heapreplace(heap, (node.next.data, i, node.next))
+        else:
+            heappop(heap)
+    return dummy.next
+    
 def mergeSortedLinklist(l1,l2):
     dummy = Node()
     tail = dummy
@@ -64,6 +103,94 @@ def mergeSortedLinklist(l1,l2):
 
     return dummy.next
 
+def iterNodes(head):
+    while head:
+        yield head.data
+        head = head.next
+
+def fromValues(values):
+    merged_list = Linklist()
+    for data in values:
+        merged_list.insertAtEnd(data)
+    return merged_list
+
+if np is not None:
+    # the merge loops run compiled over flat int64 arrays; nodes are only
+    # read before and rebuilt after, outside the jitted code
+    @njit(cache=True)
+    def _mergeArrays(a, b):
+        out = np.empty(a.size + b.size, a.dtype)
+        i = j = k = 0
+        while i<a.size and j<b.size:
+            if a[i]<b[j]:
+                out[k] = a[i]
+                i+=1
+            else:
+                out[k] = b[j]
+                j+=1
+            k+=1
+        while i<a.size:
+            out[k] = a[i]
+            i+=1
+            k+=1
+        while j<b.size:
+            out[k] = b[j]
+            j+=1
+            k+=1
+        return out
+
+    # k-way merge of the runs flat[starts[j]:ends[j]] by scanning the k heads
+    @njit(cache=True)
+    def _mergeKFlat(flat, starts, ends):
+        out = np.empty(flat.size, flat.dtype)
+        pos = starts.copy()
+        for k in range(out.size):
+            best = -1
+            for j in range(pos.size):
+                if pos[j]<ends[j] and (best==-1 or flat[pos[j]]<flat[pos[best]]):
+                    best = j
+            out[k] = flat[pos[best]]
+            pos[best]+=1
+        return out
+
+# the node values as int64 arrays, or None when numba is missing or any list
+# holds non-integers, so floats are merged as they are instead of truncated
+def intArrays(heads):
+    if np is None:
+        return None
+    arrays = []
+    for h in heads:
+        a = np.asarray(list(iterNodes(h)))
+        if a.size and a.dtype.kind not in 'iu':
+            return None
+        arrays.append(a.astype(np.int64, copy=False))
+    return arrays
+
+def mergeSortedLinklistArray(l1,l2):
+    arrays = intArrays([l1, l2])
+    if arrays is None:
+        return fromValues(merge(iterNodes(l1), iterNodes(l2)))
+    return fromValues(_mergeArrays(*arrays).tolist())
+
+def mergeKListsArray(lists):
+    if not lists:
+        return None
+    arrays = intArrays(lists)
+    if arrays is None:
+        return fromValues(merge(*[iterNodes(h) for h in lists]))
+    # scanning the heads is cheapest for a few lists; beyond that pairwise
+    # rounds, which are N log K like a heap but need no heap kernel
+    if len(arrays)<=16:
+        ends = np.cumsum(np.array([a.size for a in arrays], dtype=np.int64))
+        starts = ends - np.array([a.size for a in arrays], dtype=np.int64)
+        return fromValues(_mergeKFlat(np.concatenate(arrays), starts, ends).tolist())
+    while len(arrays)>1:
+        merged = [_mergeArrays(arrays[i], arrays[i+1]) for i in range(0, len(arrays)-1, 2)]
+        if len(arrays)%2:
+            merged.append(arrays[-1])
+        arrays = merged
+    return fromValues(arrays[0].tolist())
+
 list1 = Linklist()
 list1.insertAtEnd(1)
 list1.insertAtEnd(2)
@@ -85,7 +212,8 @@ list4 = Linklist()
 list4.insertAtEnd(10)
 list4.insertAtEnd(30)
 
+# the array version only reads the nodes, so run it before mergeKLists relinks them
+print(f'merged (array): {printList(mergeKListsArray([list1.head,list2.head,list3.head,list4.head]))}')
 m = mergeKLists([list1.head,list2.head,list3.head,list4.head])
 
 print(f'merged: {printList(m)}')
-
@@ -1,51 +1,90 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next=next
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown (e.g. head was assigned directly)
+        self.tail = None
 
     def insertAtBegining(self, data):
         node = Node(data, self.head)
+        if self.head is None:
+            self.tail = node
         self.head = node
         return node
     def insertAtEnd(self, data):
-        node =Node(data)
+        node = Node(data)
         if self.head == None:
-            self.head=node
+            self.head=self.tail=node
             return
         
-        itr = self.head
-        while itr.next:
-            itr=itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr=itr.next
         itr.next=node
+        self.tail=node
         return
 def printList(l):
     head = l.head
     if l.head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 def isPalindrome(l):    
     nums = []
+    append = nums.append
     head = l.head
 
     while head:
-        nums.append(head.data)
+        append(head.data)
         head = head.next
 
-    l,r = 0, len(nums)-1
-    while l<=r:
-        if nums[l]!=nums[r]:
-            return False
-        l+=1
-        r-=1
-    return True
+    # one C level comparison against the reversed copy
+    return nums == nums[::-1]
+
+# O(1) extra space: reverse the second half in place, walk both halves
+# together, then reverse it back so the list is left unchanged
+def isPalindromeInPlace(l):
+    if l.head is None:
+        return True
+    slow, fast = l.head, l.head.next
+    while fast and fast.next:
+        slow = slow.next
+        fast = fast.next.next
+
+    prev, second = None, slow.next
+    while second:
+        next = second.next
+        second.next = prev
+        prev = second
+        second = next
+
+    res = True
+    first, second = l.head, prev
+    while second:
+        if first.data != second.data:
+            res = False
+            break
+        first, second = first.next, second.next
+
+    second, prev = prev, None
+    while second:
+        next = second.next
+        second.next = prev
+        prev = second
+        second = next
+    slow.next = prev
+    return res
 
 l2 = Linklist()
 l2.insertAtEnd(1)
@@ -57,3 +96,4 @@ print(f'list 2 : {printList(l2)}')
 m = isPalindrome(l2)
 
 print(f'is palindrome?: {m}')
+print(f'is palindrome (in place)?: {isPalindromeInPlace(l2)}, list after: {printList(l2)}')
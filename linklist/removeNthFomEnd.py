@@ -1,36 +1,45 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next=next
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown (e.g. head was assigned directly)
+        self.tail = None
 
     def insertAtBegining(self, data):
         node = Node(data, self.head)
+        if self.head is None:
+            self.tail = node
         self.head = node
         return node
     def insertAtEnd(self, data):
-        node =Node(data)
+        node = Node(data)
         if self.head == None:
-            self.head=node
+            self.head=self.tail=node
             return
         
-        itr = self.head
-        while itr.next:
-            itr=itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr=itr.next
         itr.next=node
+        self.tail=node
         return
 def printList(l):
     head = l.head
     if l.head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 def removeNthFromEnd(l, n):
     head = l.head
     dummy = Node(0,head)
@@ -43,7 +52,11 @@ def removeNthFromEnd(l, n):
     while right:
         right = right.next
         left = left.next
-    left.next = left.next.next
+    removed = left.next
+    left.next = removed.next
+    # the input list changed shape: keep its head valid, forget its tail
+    l.head = dummy.next
+    l.tail = None
     merged_list = Linklist()
     merged_list.head = dummy.next
     return merged_list
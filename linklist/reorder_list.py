@@ -1,39 +1,50 @@
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next=next
 class Linklist:
     def __init__(self):
         self.head = None
+        # last node, or None when unknown (e.g. head was assigned directly)
+        self.tail = None
 
     def insertAtBegining(self, data):
         node = Node(data, self.head)
+        if self.head is None:
+            self.tail = node
         self.head = node
         return node
     def insertAtEnd(self, data):
-        node =Node(data)
+        node = Node(data)
         if self.head == None:
-            self.head=node
+            self.head=self.tail=node
             return
         
-        itr = self.head
-        while itr.next:
-            itr=itr.next
+        itr = self.tail
+        if itr is None:
+            itr = self.head
+            while itr.next:
+                itr=itr.next
         itr.next=node
+        self.tail=node
         return
 def printList(l):
     head = l.head
     if l.head is None:
         return "None"
-    list_str = ''
+    parts = []
     while head:
-        list_str = list_str + str(head.data) + "-->"
+        parts.append(str(head.data) + "-->")
         head = head.next
 
-    return list_str
+    return ''.join(parts)
 def reorderList(l):
+    if l.head is None:
+        return l
     slow, fast = l.head, l.head.next
-    while fast:
+    while fast and fast.next:
         slow = slow.next
         fast = fast.next.next
     second = slow.next
@@ -46,10 +57,10 @@ def reorderList(l):
     first, second = l.head, prev
     while second:
         temp1, temp2 = first.next, second.next
-        print(f'first valuee: {first.data}, second value: {second.data}')
         first.next = second
         second.next = temp1
         first, second = temp1,temp2
+    l.tail = None
     rl = Linklist()
     rl.head = l.head
     return rl
@@ -65,3 +76,5 @@ l2.insertAtEnd(4)
 l2.insertAtEnd(5)
 print(f'list : {printList(l2)}')
 print(f'reordered list: {printList(reorderList(l2))}')
+l2.insertAtEnd(6)
+print(f'reordered again with 6 appended: {printList(reorderList(l2))}')
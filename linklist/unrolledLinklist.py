@@ -0,0 +1,112 @@
+# unrolled linked list: every node (chunk) holds up to CHUNK_SIZE values in a
+# small array, so a full traversal follows one next pointer per CHUNK_SIZE
+# values instead of one per value
+from itertools import zip_longest
+
+CHUNK_SIZE = 8
+
+class Chunk:
+    __slots__ = ('items', 'n', 'next')
+
+    def __init__(self):
+        self.items = [None]*CHUNK_SIZE
+        self.n = 0
+        self.next = None
+
+class UnrolledLinklist:
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def insertAtEnd(self, data):
+        tail = self.tail
+        if tail is None:
+            tail = self.head = self.tail = Chunk()
+        elif tail.n == CHUNK_SIZE:
+            # only allocate when the last chunk overflows
+            tail.next = Chunk()
+            tail = self.tail = tail.next
+        tail.items[tail.n] = data
+        tail.n += 1
+        self.size += 1
+
+    def insertAtBegining(self, data):
+        head = self.head
+        if head is None or head.n == CHUNK_SIZE:
+            chunk = Chunk()
+            chunk.next = head
+            self.head = head = chunk
+            if self.tail is None:
+                self.tail = chunk
+        else:
+            # shift inside the first chunk, at most CHUNK_SIZE-1 moves
+            head.items[1:head.n+1] = head.items[:head.n]
+        head.items[0] = data
+        head.n += 1
+        self.size += 1
+
+    def __iter__(self):
+        ch = self.head
+        while ch:
+            items = ch.items
+            for i in range(ch.n):
+                yield items[i]
+            ch = ch.next
+
+    def __len__(self):
+        return self.size
+
+def fromValues(values):
+    l = UnrolledLinklist()
+    for data in values:
+        l.insertAtEnd(data)
+    return l
+
+def printList(l):
+    if l.head is None:
+        return "None"
+    return ''.join(str(data) + "-->" for data in l)
+
+# digits are stored least significant first, like linklist/addTwoNumbers.py
+def addTwoList(l1,l2):
+    res = UnrolledLinklist()
+    carry = 0
+    for val1, val2 in zip_longest(l1, l2, fillvalue=0):
+        val = val1+val2+carry
+        carry = val//10
+        res.insertAtEnd(val%10)
+    if carry:
+        res.insertAtEnd(carry)
+    return res
+
+def mergeSortedLinklist(l1,l2):
+    res = UnrolledLinklist()
+    it1, it2 = iter(l1), iter(l2)
+    done = object()
+    a, b = next(it1, done), next(it2, done)
+    while a is not done and b is not done:
+        if a<b:
+            res.insertAtEnd(a)
+            a = next(it1, done)
+        else:
+            res.insertAtEnd(b)
+            b = next(it2, done)
+    while a is not done:
+        res.insertAtEnd(a)
+        a = next(it1, done)
+    while b is not done:
+        res.insertAtEnd(b)
+        b = next(it2, done)
+    return res
+
+if __name__=='__main__':
+    l1 = fromValues([4,3,2,1])
+    l2 = fromValues([1,2,3,4])
+    print(f'list 1: {printList(l1)}')
+    print(f'list 2 : {printList(l2)}')
+    print(f'sum of  two linklist: {printList(addTwoList(l1,l2))}')
+
+    l3 = fromValues(range(0, 20, 2))
+    l4 = fromValues(range(1, 20, 3))
+    print(f'merged: {printList(mergeSortedLinklist(l3,l4))}')
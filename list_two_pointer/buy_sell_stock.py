@@ -1,8 +1,16 @@
 #You are given an array prices where prices[i] is the price of a given stock on the ith day.
 
 #You want to maximize your profit by choosing a single day to buy one stock and choosing a different day in the future to sell that stock.
-def maxProfit(prices):
-    min_price = float('inf')
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+def _maxProfit(prices):
+    if len(prices)==0:
+        return 0
+    min_price = prices[0]
     max_price = 0
     
     for price in prices:
@@ -12,4 +20,16 @@ def maxProfit(prices):
         if profit>max_price:
             max_price=profit
     return max_price
-print(maxProfit([2,1,2,1,0,1,2]))
\ No newline at end of file
+
+if np is not None:
+    _maxProfit_nb = njit(cache=True)(_maxProfit)
+
+def maxProfit(prices):
+    # the compiled kernel only sees integer input; anything else (floats,
+    # decimals) runs the plain loop and keeps its own number type
+    if np is not None:
+        a = np.asarray(prices)
+        if a.dtype.kind in 'iu':
+            return int(_maxProfit_nb(a.astype(np.int64, copy=False)))
+    return _maxProfit(prices)
+print(maxProfit([2,1,2,1,0,1,2]))
@@ -1,5 +1,11 @@
 from typing import List
-def maxArea(height: List[int]) -> int:
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+def _maxArea(height):
     res = 0
     l,r = 0, len(height)-1
 
@@ -11,4 +17,15 @@ def maxArea(height: List[int]) -> int:
         else:
             r-=1
     return res
-print(maxArea([1,8,6,2,5,4,8,3,7]))
\ No newline at end of file
+
+if np is not None:
+    _maxArea_nb = njit(cache=True)(_maxArea)
+
+def maxArea(height: List[int]) -> int:
+    # njit only for integer heights, other inputs take the loop as given
+    if np is not None:
+        a = np.asarray(height)
+        if a.dtype.kind in 'iu':
+            return int(_maxArea_nb(a.astype(np.int64, copy=False)))
+    return _maxArea(height)
+print(maxArea([1,8,6,2,5,4,8,3,7]))
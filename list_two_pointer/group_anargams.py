@@ -3,15 +3,27 @@
 #Output: [["bat"],["nat","tan"],["ate","eat","tea"]]
 
 from collections import defaultdict
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def signature(st):
+    if np is not None:
+        #letter counts in one C call, keyed as a single bytes blob instead of
+        #a 26 int tuple
+        codes = np.frombuffer(st.encode(), dtype=np.uint8) - ord("a")
+        return np.bincount(codes, minlength=26).astype(np.uint32).tobytes()
+    cnt = [0]*26
+    for c in st:
+        cnt[ord(c)-ord("a")]+=1
+    return tuple(cnt)
+
 def groupAnargams(strs):
     dic = defaultdict(list)
 
     for st in strs:
-        cnt = [0]*26
-
-        for c in st:
-            cnt[ord(c)-ord("a")]+=1
-        dic[tuple(cnt)].append(st)
+        dic[signature(st)].append(st)
 
     return list(dic.values())
 
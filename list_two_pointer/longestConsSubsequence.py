@@ -1,6 +1,18 @@
-
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def longestConsecutive(nums):
+    if np is not None:
+        #sorted unique values; a run ends wherever the gap isn't 1
+        a = np.unique(np.asarray(nums))
+        if a.size==0:
+            return 0
+        breaks = np.flatnonzero(np.diff(a)!=1)
+        runs = np.diff(np.concatenate(([-1], breaks, [a.size-1])))
+        return int(runs.max())
+
     res=0
     nums = set(nums)
 
@@ -10,4 +22,4 @@ def longestConsecutive(nums):
             while n+curr in nums:
                 curr+=1
             res = max(res, curr)
-    return res
\ No newline at end of file
+    return res
@@ -1,16 +1,23 @@
 #sliding window
+from collections import defaultdict
+
+#remember where each character was last seen, so the left edge can jump past
+#a repeat directly: O(n) time
 def longestSubstring(word):
     l=0
     res = 0
-    arr = []
-    for r in range(len(word)):
-        while word[r] in arr:
-            arr.pop(0)
-            l+=1
-        arr.append(word[r])
-        res = max(res, r-l+1)
+    # bytes index to small ints: a flat table replaces the dict
+    last = [-1]*256 if isinstance(word, (bytes, bytearray)) else defaultdict(lambda: -1)
+    for r, c in enumerate(word):
+        prev = last[c]
+        if prev>=l:
+            l = prev+1
+        last[c] = r
+        if r-l+1>res:
+            res = r-l+1
     return res
 
 
 length = longestSubstring('aabbbcabbcd')
-print(length)
\ No newline at end of file
+print(length)
+print(longestSubstring(b'aabbbcabbcd'))
@@ -1,5 +1,11 @@
 #used kadane's algorithm
-def maxSubArray(nums):
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+def _maxSubArray(nums):
         maxcurr=maxglob=nums[0]
         for i in range(1,len(nums)):
             maxcurr = max(nums[i], maxcurr+nums[i])
@@ -7,4 +13,15 @@ def maxSubArray(nums):
                   maxglob=maxcurr
         return maxglob
 
-print(maxSubArray([-2,1,-3,4,-1,2,1,-5,4]))
\ No newline at end of file
+if np is not None:
+    _maxSubArray_nb = njit(cache=True)(_maxSubArray)
+
+def maxSubArray(nums):
+    # compiled kernel for integer input only, floats keep the plain loop
+    if np is not None:
+        a = np.asarray(nums)
+        if a.dtype.kind in 'iu':
+            return int(_maxSubArray_nb(a.astype(np.int64, copy=False)))
+    return _maxSubArray(nums)
+
+print(maxSubArray([-2,1,-3,4,-1,2,1,-5,4]))
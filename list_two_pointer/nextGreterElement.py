@@ -1,14 +1,12 @@
+#monotonic stack: every value waits on a decreasing stack until a bigger one
+#arrives, so each element is pushed and popped once: O(len(nums2))
 def nextGreaterElement(nums1, nums2):
-    res = [-1]*len(nums1)
-    l2=len(nums2)
-    idx_nums1 = {n:i for i,n in enumerate(nums1)}
-    for i in range(l2):
-        if nums2[i] not in idx_nums1:
-            continue
-        for j in range(i+1,l2):
-            if nums2[j]>nums2[i]:
-                res[idx_nums1[nums2[i]]]=nums2[j]
-                break
-    return res
+    stack = []
+    greater = {}
+    for n in nums2:
+        while stack and stack[-1]<n:
+            greater[stack.pop()] = n
+        stack.append(n)
+    return [greater.get(n, -1) for n in nums1]
 
-print(nextGreaterElement([4,1,2],[1,3,4,2]))
\ No newline at end of file
+print(nextGreaterElement([4,1,2],[1,3,4,2]))
@@ -1,17 +1,36 @@
 #Given an integer array nums, return an array answer such that answer[i] is equal to the product of all the elements of nums except nums[i].
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+#prefix products go straight into res, then one backward pass multiplies in
+#a running suffix product: no second array
 def productExceptSelf(nums):
     l = len(nums)
-    preProduct = [1]*l
-    posProduct= [1]*l
-    res = [0]*l
+    res = [1]*l
     for i in range(1,l):
-        preProduct[i] = nums[i-1]*preProduct[i-1]
+        res[i] = nums[i-1]*res[i-1]
 
-    for j in range(l-2, -1, -1):
-        posProduct[j] = nums[j+1]*posProduct[j+1]
-    for k in range(l):
-        res[k]=preProduct[k]*posProduct[k]
+    suffix = 1
+    for j in range(l-1, -1, -1):
+        res[j]*=suffix
+        suffix*=nums[j]
     return res
 
-print(productExceptSelf([2,3,4,5]))
\ No newline at end of file
+#both scans as np.cumprod over int64; products past int64 wrap around, so
+#this is for inputs known to fit
+def productExceptSelfNp(nums):
+    if np is None or len(nums)==0:
+        return productExceptSelf(nums)
+    a = np.asarray(nums, dtype=np.int64)
+    left = np.empty_like(a)
+    left[0] = 1
+    np.cumprod(a[:-1], out=left[1:])
+    right = np.empty_like(a)
+    right[-1] = 1
+    np.cumprod(a[:0:-1], out=right[-2::-1])
+    return (left*right).tolist()
+
+print(productExceptSelf([2,3,4,5]))
+print(productExceptSelfNp([2,3,4,5]))
@@ -1,9 +1,16 @@
+from collections import Counter
 
+#bucket sort by frequency: a count can't exceed len(nums), so no comparison sort
 def topKElement(nums,k):
-    dic={}
-    for n in nums:
-        dic[n] = 1+ dic.get(n,0)
-    sorted_dic = sorted(dic.items(), key=lambda x:x[1], reverse=True)
+    freq = [[] for _ in range(len(nums)+1)]
+    for n, c in Counter(nums).items():
+        freq[c].append(n)
 
-    return [sorted_dic[i][0] for i in range(k) ]
-print(topKElement([1,1,1,2,2,3],2))
\ No newline at end of file
+    res = []
+    for c in range(len(nums), 0, -1):
+        for n in freq[c]:
+            res.append(n)
+            if len(res)==k:
+                return res
+    return res
+print(topKElement([1,1,1,2,2,3],2))
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+#memoized: each num is computed once, O(n) calls instead of O(phi^n)
+@lru_cache(maxsize=None)
 def fibonacci(num):
     if num<0:
         return "invalid input"
@@ -28,3 +32,18 @@ def loopfib(num):
             res.append(c)
         return res
 print(loopfib(9))
+
+#fast doubling: F(2k) = F(k)*(2F(k+1)-F(k)), F(2k+1) = F(k)^2+F(k+1)^2
+#O(log n) big int multiplications
+def fastfib(num):
+    if num<0:
+        return "invalid input"
+    def fd(n):
+        if n==0:
+            return (0, 1)
+        a, b = fd(n>>1)
+        c = a*(2*b-a)
+        d = a*a+b*b
+        return (d, c+d) if n&1 else (c, d)
+    return fd(num)[0]
+print(fastfib(9))
@@ -2,29 +2,42 @@
 # to execute current task. let see some examples
 import asyncio
 
+# uvloop is a drop-in event loop built on libuv, the loop created below picks it up
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# every example below runs on this one loop, asyncio.run would build and tear down a new loop each time
+loop = asyncio.new_event_loop()
+asyncio.set_event_loop(loop)
+
 async def say_hello():
     await asyncio.sleep(2)
     print('hello world')
 
-asyncio.run(say_hello())
+loop.run_until_complete(say_hello())
 
 async def do_something_else():
     print('start execution another task')
     await asyncio.sleep(1)
     print('finished another task')
-async def main():
+async def main_gather():
     await asyncio.gather(
         say_hello(),
         do_something_else()
     )
-asyncio.run(main())
+loop.run_until_complete(main_gather())
 
 import requests
 import time
+from time import monotonic as _now
+from typing import Optional
 import aiohttp
 import aiofiles
 # lets see the time differences between sync and async
-start_time = time.time()
+start_time = _now()
 
 def fetch(url):
     return requests.get(url).text
@@ -32,61 +45,104 @@ def fetch(url):
 page1 = fetch('http://example.com')
 page2 = fetch('http://example.org')
 
-print(f"Done in {time.time() - start_time} seconds")
+print(f"Done in {_now() - start_time} seconds")
+
+# one session for the whole program: it owns the TCP connection pool, so reusing it
+# keeps connections alive between batches instead of doing a new handshake per host
+_SESSION: Optional[aiohttp.ClientSession] = None
+# how many requests may be in flight to the same host at once
+NUM_CONNS_PER_HOST = 10
+
+async def get_session():
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=0, limit_per_host=NUM_CONNS_PER_HOST, ttl_dns_cache=300, keepalive_timeout=30))
+    return _SESSION
+
+async def close_session():
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
 
 #async function
-async def fetch_async(url, session):
+async def fetch_async(url, session=None):
+    if session is None:
+        session = await get_session()
     async with session.get(url) as response:
         return await response.text()
 
-async def main():
-    async with aiohttp.ClientSession() as session:
-        page1 = asyncio.create_task(fetch_async('http://example.com', session))
-        page2 = asyncio.create_task(fetch_async('http://example.org', session))
-        await asyncio.gather(page1, page2)
+async def main_http():
+    # the session stays open after this batch, later fetches on the same loop reuse its connections
+    session = await get_session()
+    await asyncio.gather(
+        fetch_async('http://example.com', session),
+        fetch_async('http://example.org', session),
+    )
 
-start_time = time.time()
-asyncio.run(main())
-print(f"Done in {time.time() - start_time} seconds")
+start_time = _now()
+loop.run_until_complete(main_http())
+print(f"Done in {_now() - start_time} seconds")
 
 # Asynchronously reading a single file
+# at most 64 files are open at once, gathering thousands of reads unbounded only adds latency
+_READ_SEM = asyncio.Semaphore(64)
+
 async def read_file_async(filepath):
-    async with aiofiles.open(filepath, 'r') as file:
-        return await file.read()
+    async with _READ_SEM:
+        async with aiofiles.open(filepath, 'r') as file:
+            return await file.read()
 
 async def read_all_async(filepaths):
     tasks = [read_file_async(filepath) for filepath in filepaths]
     return await asyncio.gather(*tasks)
 
 # Running the async function
-async def main():
+async def main_files():
     filepaths = ['file1.txt', 'file2.txt']
     data = await read_all_async(filepaths)
     print(data)
 
-asyncio.run(main())
+loop.run_until_complete(main_files())
 #Sometimes, you can’t escape synchronous functions but still want to enjoy the async ride. Here’s how you can mix them:
 import asyncio
+import concurrent.futures
 import time
 
+# a fixed size pool created once, instead of the default executor that asyncio builds on first use
+_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="aio-blocking")
+
 def sync_task():
     print("Starting a slow sync task...")
     time.sleep(5)  # Simulating a long task
     print("Finished the slow task.")
 
+# look the loop and its run_in_executor up once, the returned coroutine function reuses them on every call
+def make_async_wrapper(loop=None, executor=_EXEC):
+    run_in_exec = (loop or asyncio.get_event_loop()).run_in_executor
+    async def wrapper(fn, *args):
+        return await run_in_exec(executor, fn, *args)
+    return wrapper
+
+run_sync = make_async_wrapper(loop)
+
 async def async_wrapper():
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, sync_task)
+    await run_sync(sync_task)
 
-async def main():
+async def main_mix():
     await asyncio.gather(
         async_wrapper(),
         # Imagine other async tasks here
     )
 
-asyncio.run(main())
+loop.run_until_complete(main_mix())
+# the session is bound to this loop, close it before the loop goes away
+loop.run_until_complete(close_session())
+loop.close()
 
 import asyncio
+import threading
 from threading import Thread
 import time
 
@@ -101,6 +157,25 @@ def run_event_loop(loop):
     loop.run_forever()
 
 
+def submit(loop, coro):
+    """Schedule coro on loop, only paying for the thread-safe wakeup when called from another thread"""
+    # asyncio stores the id of the thread running the loop in loop._thread_id (None when stopped)
+    if threading.get_ident() == getattr(loop, "_thread_id", None):
+        loop.call_soon(asyncio.create_task, coro)
+    else:
+        loop.call_soon_threadsafe(asyncio.create_task, coro)
+
+
+def _spawn_all(coros):
+    for c in coros:
+        asyncio.create_task(c)
+
+
+def submit_many(loop, coros):
+    """Schedule several coroutines with a single wakeup of the loop instead of one per coroutine"""
+    loop.call_soon_threadsafe(_spawn_all, list(coros))
+
+
 async def process_task(task_id):
     print(f"[async task] Processing task {task_id}...")
     await asyncio.sleep(2)  # Simulate async I/O work
@@ -120,11 +195,12 @@ if __name__ == "__main__":
 
     # Simulate the main thread doing some synchronous work
     print("[main thread] Submitting task 1 to async loop...")
-    background_loop.call_soon_threadsafe(asyncio.create_task, process_task(1))
+    submit(background_loop, process_task(1))
 
     time.sleep(1)
-    print("[main thread] Submitting task 2 to async loop...")
-    background_loop.call_soon_threadsafe(asyncio.create_task, process_task(2))
+    print("[main thread] Submitting task 2 and 3 to async loop...")
+    pending = [process_task(2), process_task(3)]
+    submit_many(background_loop, pending)
 
     print("[main thread] Doing other sync work while async tasks run...")
     time.sleep(5)
@@ -133,11 +209,13 @@ if __name__ == "__main__":
 # [worker thread] Starting async loop...
 # [main thread] Submitting task 1 to async loop...
 # [async task] Processing task 1...
-# [main thread] Submitting task 2 to async loop...
+# [main thread] Submitting task 2 and 3 to async loop...
 # [main thread] Doing other sync work while async tasks run...
-# [async task] Done with task 1
 # [async task] Processing task 2...
+# [async task] Processing task 3...
+# [async task] Done with task 1
 # [async task] Done with task 2
+# [async task] Done with task 3
 # [main thread] Done.
 
 #You see how the main thread continues to run while the async tasks execute in parallel in the background thread.
@@ -1,5 +1,6 @@
 import concurrent.futures
 import time
+from time import monotonic as _now
 
 def task(name):
     print(f"Starting task {name}")
@@ -35,12 +36,33 @@ urls = [
 ]
 
 # Using ThreadPoolExecutor to download pages concurrently
-start_time = time.time()
+start_time = _now()
 
-with concurrent.futures.ThreadPoolExecutor() as executor:
+# one thread per url is the most this fan-out can use
+with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(urls))) as executor:
     futures = [executor.submit(download_page, url) for url in urls]
     for future in concurrent.futures.as_completed(futures):
         print(future.result())
 
-end_time = time.time()
-print(f"Downloaded all pages in {end_time - start_time:.2f} seconds")
\ No newline at end of file
+end_time = _now()
+print(f"Downloaded all pages in {end_time - start_time:.2f} seconds")
+# the same fan-out with asyncio + aiohttp: one thread, one session, and the
+# downloads are coroutines instead of threads blocked in requests.get
+import asyncio
+import aiohttp
+
+async def download_page_async(session, url):
+    async with session.get(url) as response:
+        body = await response.read()
+    return f"{url} - {len(body)} bytes"
+
+async def download_all(urls):
+    async with aiohttp.ClientSession() as session:
+        # print each page as it finishes, like as_completed above
+        for coro in asyncio.as_completed([download_page_async(session, url) for url in urls]):
+            print(await coro)
+
+start_time = _now()
+asyncio.run(download_all(urls))
+end_time = _now()
+print(f"Downloaded all pages with asyncio in {end_time - start_time:.2f} seconds")
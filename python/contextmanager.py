@@ -1,13 +1,17 @@
-class FileManager():
-    def __init__(self, filename, mode):
-        self.filename = filename
-        self.mode = mode
-        self.file = None
-    
-    def __enter__(self):
-        self.file = open(self.filename, self.mode)
-        return self.file
-    def __exit__(self, exc_type, exc_value, exc_traceback):
-        self.file.close()
+from contextlib import contextmanager
+
+# generator based context manager: code before yield is __enter__, the finally block is __exit__
+@contextmanager
+def FileManager(filename, mode):
+    f = open(filename, mode)
+    try:
+        yield f
+    finally:
+        f.close()
+
 with FileManager("hello.txt", 'a') as f:
-    f.write("hello world")
\ No newline at end of file
+    f.write("hello world")
+
+# open() is a context manager itself, a wrapper only pays off with extra enter/exit logic
+with open("hello.txt", 'a') as f:
+    f.write("hello world")
@@ -1,14 +1,22 @@
 #python decorator
-import time
+import atexit
+import functools
+from time import perf_counter_ns as clk
 
+# accumulates the time spent in func instead of printing on every call, the total is printed once at exit
 def time_func(func):
-    def wrapper():
-        print("befor calling actual function")
-        start_time = time.time()
-        func()
-        print("after calling actual function")
-        end_time = time.time()
-        print(f'calling time{start_time-end_time}')
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        t0 = clk()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wrapper.total_ns += clk() - t0
+            wrapper.calls += 1
+    wrapper.total_ns = 0
+    wrapper.calls = 0
+    atexit.register(lambda: wrapper.calls and print(
+        f'{func.__name__}: {wrapper.calls} calls, {wrapper.total_ns/1e6:.3f} ms'))
     return wrapper
 
 @time_func
@@ -19,11 +27,13 @@ def test():
 #applying multiple decoretor
 
 def bold_decoretor(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         print('inside first decoretor')
         return "<b>" + func(*args, **kwargs) + "</b>"
     return wrapper
 def italic_decorator(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         print('inside second decoretor')
         return "<i>" + func(*args, **kwargs) + "</i>"
@@ -34,4 +44,22 @@ def italic_decorator(func):
 def get_text(text):
     return text
 
-print(get_text('hello world'))
\ No newline at end of file
+print(get_text('hello world'))
+# the same result with one wrapper: the tags are assembled into a template once at decoration
+# time, so a call is one frame and one format instead of a frame and a concat per decorator
+def compose_html(*tags):
+    template = '{}'
+    for t in tags:
+        template = f'<{t}>{template}</{t}>'
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return template.format(func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+@compose_html('b', 'i')
+def get_text_composed(text):
+    return text
+
+print(get_text_composed('hello world'))
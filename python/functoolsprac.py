@@ -1,4 +1,5 @@
 from functools import *
+import math
 
 #partial
 def power(a,b):
@@ -33,9 +34,18 @@ def cmp_key(a,b):
         return 0
     
 data = [30,2,13,-3,16,80,1]
-sorted_list = sorted(data, key=cmp_to_key(cmp_key))
+# cmp_key is plain numeric order, so the default comparison does it without a Python call per compare
+sorted_list = sorted(data)
 print(f'sort of this {data} list is: {sorted_list}')
 
+# cmp_to_key is for orders that depend on both items, like concatenating to the largest number
+def concat_cmp(a,b):
+    return cmp_key(a+b, b+a)
+
+digits = ['3','30','34','5','9']
+largest = ''.join(sorted(digits, key=cmp_to_key(concat_cmp), reverse=True))
+print(f'largest number from {digits}: {largest}')
+
 #reduce
 list1 = [30,2,13,-3,16,80,1]
 sum_of_list1 = reduce(lambda a,b:a+b, list1)
@@ -60,14 +70,40 @@ print('2 <= 7:', N(2) <= N(7))
 print('9 >= 10:', N(9) >= N(10))
 print('5 == 5:', N(5) == N(5))
 
+# total_ordering builds >, <= and >= on top of __lt__ and __eq__, so each of them costs two
+# python calls. when the objects get sorted or pushed on a heap a lot, write all of them out
+class FastN():
+    __slots__ = ('value',)
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self,other):
+        return self.value<other.value
+    def __le__(self,other):
+        return self.value<=other.value
+    def __gt__(self,other):
+        return self.value>other.value
+    def __ge__(self,other):
+        return self.value>=other.value
+    def __eq__(self, other):
+        return self.value==other.value
+
+print('9 >= 10:', FastN(9) >= FastN(10))
+print('sorted:', [n.value for n in sorted(FastN(v) for v in (5,3,8))])
+
 #lru cash
-@lru_cache(maxsize=None)
-def factorial(n):
-    if n <= 1:
-        return 1
-    return n * factorial(n-1)
+# math.factorial is already a C loop, caching only pays off when calls overlap like in fib
+factorial = math.factorial
+
+@lru_cache(maxsize=128)
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n-1) + fib(n-2)
 
 print([factorial(n) for n in range(7)])
+print([fib(n) for n in range(10)])
+print(fib.cache_info())
 
 #singledispatch
 @singledispatch
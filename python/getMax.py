@@ -19,15 +19,14 @@ print(max(birth_year)) ## Returns "Oliver"
 max_val = max(birth_year, key=lambda k: birth_year[k])
 print(max_val)
 '''
+from operator import itemgetter
+
 def sortListOfTuple(lis):
-    copy_lis = lis.copy()
-    by_number = lambda x:x[1]
-    copy_lis.sort(key=by_number)
-    return copy_lis
+    return sorted(lis, key=itemgetter(1))
 def reverseName(name):
     name = name[::-1]
     return name
 
-prices = [('banana', '2'), ('mango',7), ('melon',8),('apple',1)]
+prices = [('banana', 2), ('mango',7), ('melon',8),('apple',1)]
 x = sortListOfTuple(prices)
 print(x)
\ No newline at end of file
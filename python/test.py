@@ -1,8 +1,21 @@
 import re
-import num2words
+from num2words import num2words
+
+_DIGITS = re.compile(r'\d+')
+
+class _PunctTable(dict):
+    """str.translate table that drops every char outside [\\w\\s], filled in as chars are seen"""
+    def __missing__(self, c):
+        ch = chr(c)
+        self[c] = ch if ch.isalnum() or ch.isspace() or ch == '_' else None
+        return self[c]
+
+_PUNCT_TABLE = _PunctTable()
+
 def _normalize_transcript_words( text):
-    text = re.sub(r'\d+', lambda x: num2words(int(x.group())), text)
-    text = re.sub(r'[^\w\s]', '', text)
+    text = _DIGITS.sub(lambda x: num2words(int(x.group())), text)
+    # spelled numbers can contain '-' and ',' so punctuation goes after the numbers are replaced
+    text = text.translate(_PUNCT_TABLE)
     return text.lower().split()
-    
-print(_normalize_transcript_words('1/2 of the 1st and 2nd and 3rd'))
\ No newline at end of file
+
+print(_normalize_transcript_words('1/2 of the 1st and 2nd and 3rd'))
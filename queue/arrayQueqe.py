@@ -1,7 +1,10 @@
 #Queue implementation in array
+from array import array
 
 class Queue:
-    def __init__(self, capacity):
+    # debug=True prints every operation, off by default so enQueue/deQueue only do the queue work
+    def __init__(self, capacity, debug=False):
+        self.debug = debug
         self.size = 0
         self.rare = capacity -1
         self.front=0
@@ -21,17 +24,20 @@ class Queue:
         self.rare = (self.rare+1) % self.capacity
         self.Q[self.rare]=data
         self.size = self.size + 1
-        print(f'{data} is inserted in position of {self.rare}')
+        if self.debug:
+            print(f'{data} is inserted in position of {self.rare}')
         return
     
     def deQueue(self):
         if self.isEmpty():
             print('Queue is empty')
             return
-        print(f'deque element is: {self.Q[self.front]}')
+        data = self.Q[self.front]
+        if self.debug:
+            print(f'deque element is: {data}')
         self.front = (self.front+1) % self.capacity
         self.size = self.size - 1
-        return
+        return data
     def qFront(self):
         if self.isEmpty():
             print('queue is empty')
@@ -44,10 +50,41 @@ class Queue:
             return
         print(f'Rare element if the queue is {self.Q[self.rare]}')
 
+# same ring buffer for int64 values, stored unboxed in an array('q') instead of a list of objects.
+# enqueue_many/dequeue_many move whole slices through a memoryview, at most two copies per call
+class IntQueue(Queue):
+    def __init__(self, capacity, debug=False):
+        super().__init__(capacity, debug)
+        self.Q = array('q', [0])*capacity
+        self._mv = memoryview(self.Q)
+
+    def enqueue_many(self, buf):
+        buf = memoryview(array('q', buf))
+        n = len(buf)
+        if n > self.capacity - self.size:
+            print('Queue is full')
+            return
+        start = (self.rare+1) % self.capacity
+        first = min(n, self.capacity - start)
+        self._mv[start:start+first] = buf[:first]
+        self._mv[:n-first] = buf[first:]
+        self.rare = (self.rare+n) % self.capacity
+        self.size = self.size + n
+        return
+
+    def dequeue_many(self, n):
+        n = min(n, self.size)
+        first = min(n, self.capacity - self.front)
+        res = array('q', self._mv[self.front:self.front+first])
+        res.extend(self._mv[:n-first])
+        self.front = (self.front+n) % self.capacity
+        self.size = self.size - n
+        return res
+
 
     
 if __name__=='__main__':
-    q = Queue(5)
+    q = Queue(5, debug=True)
     q.enQueue(10)
     q.enQueue(20)
     q.enQueue(30)
@@ -67,3 +104,8 @@ if __name__=='__main__':
     q.deQueue()
     print(q.Q)
 
+    iq = IntQueue(5)
+    iq.enqueue_many([1, 2, 3, 4])
+    print(iq.dequeue_many(3))
+    iq.enqueue_many([5, 6, 7])
+    print(iq.dequeue_many(5))
@@ -1,55 +1,41 @@
 #Queue implementation by Linklist
-
-class Node:
-    def __init__(self, data, next=None):
-        self.data = data
-        self.next = next
+# collections.deque is a doubly linked list of fixed size blocks written in C, so it does the
+# work of the front/rare Node chain without allocating a python object per element
+from collections import deque
 
 class Queue:
-    def __init__(self):
-        self.front = None
-        self.rare = None
+    # debug=True prints every operation, off by default so enQueue/deQueue only do the queue work
+    def __init__(self, debug=False):
+        self._dq = deque()
+        self.debug = debug
 
     def isEmpty(self):
-        return self.front==None
-    
-    def enQueue(self, data):
-        node = Node(data)
+        return not self._dq
 
-        if self.isEmpty():
-            self.front = self.rare = node
-        self.rare.next = node
-        self.rare = node
-        print(f'{data} is inserted in queue')
+    def enQueue(self, data):
+        self._dq.append(data)
+        if self.debug:
+            print(f'{data} is inserted in queue')
         return
-    
+
     def deQueue(self):
         if self.isEmpty():
             print('queue is empty')
             return
-        temp = self.front
-        self.front = temp.next
-        print(f'{temp.data} is picked from queue')
-
-        if self.front==None:
-            self.rare=None
-
-        return
+        data = self._dq.popleft()
+        if self.debug:
+            print(f'{data} is picked from queue')
+        return data
     def printlinklist(self):
         if self.isEmpty():
             print('link list is empty')
             return
-        lis = ""
-        itr = self.front
-        while itr:
-            lis += str(itr.data) + "-->"
-            itr = itr.next
-        print(lis)
+        print(''.join(f'{data}-->' for data in self._dq))
 
         return
-    
+
 if __name__=='__main__':
-    q = Queue()
+    q = Queue(debug=True)
     q.enQueue(10)
     q.enQueue(20)
     q.printlinklist()
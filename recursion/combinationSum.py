@@ -1,11 +1,33 @@
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+# reach[i] is a bitset of every sum 0..target that candidate[i:] can make, each number used any
+# number of times. a branch whose remaining sum is not set in it has no solution, so it is cut
+def reachableSums(candidate, target):
+    mask = (1<<(target+1))-1
+    reach = [0]*(len(candidate)+1)
+    reach[-1] = r = 1
+    for i in range(len(candidate)-1, -1, -1):
+        # shifting by c, 2c, 4c, ... adds every multiple of c in log(target/c) steps
+        step = candidate[i]
+        while step <= target:
+            r = (r | (r<<step)) & mask
+            step <<= 1
+        reach[i] = r
+    return reach
+
 def combinationSum(candidate, target):
     res = []
+    reach = reachableSums(candidate, target)
 
     def dfs(i, cur, total):
         if total == target:
             res.append(cur.copy())
             return
-        if i>=len(candidate) or total>target:
+        if i>=len(candidate) or total>target or not (reach[i]>>(target-total)) & 1:
             return
         cur.append(candidate[i])
         dfs(i, cur, total+candidate[i])
@@ -20,12 +42,13 @@ def combinationSum(candidate, target):
 def combinationSum1(candidate, target):
     res = []
     curr = []
+    reach = reachableSums(candidate, target)
 
     def backtrack(index, remainingsum):
         if remainingsum==0:
             res.append(curr.copy())
             return
-        if remainingsum<0:
+        if remainingsum<0 or not (reach[index]>>remainingsum) & 1:
             return
         
         for i in range(index, len(candidate)):
@@ -35,4 +58,30 @@ def combinationSum1(candidate, target):
     backtrack(0,target)
     return res
 
-print(combinationSum1([2,3,6,7], 7))
\ No newline at end of file
+# only the number of combinations: unbounded knapsack count, O(len(candidate) * target).
+# going through the candidates in the outer loop counts each multiset once, like the search above
+def combinationSumCount(candidate, target):
+    dp = [0]*(target+1)
+    dp[0] = 1
+    for c in candidate:
+        for s in range(c, target+1):
+            dp[s] += dp[s-c]
+    return dp[target]
+
+if np is not None:
+    @njit(cache=True)
+    def _combinationSumCount(candidate, target):
+        dp = np.zeros(target+1, dtype=np.int64)
+        dp[0] = 1
+        for c in candidate:
+            for s in range(c, target+1):
+                dp[s] += dp[s-c]
+        return dp[target]
+
+    # int64 counts, for large targets where the count can pass 2**63 use combinationSumCount
+    def combinationSumCountNb(candidate, target):
+        return int(_combinationSumCount(np.asarray(candidate, dtype=np.int64), target))
+
+if __name__=='__main__':
+    print(combinationSum1([2,3,6,7], 7))
+    print(combinationSumCount([2,3,6,7], 7))
@@ -1,19 +1,36 @@
+# reach[i] is a bitset of every sum 0..target that candidates[i:] can make, each number used at
+# most once. a branch whose remaining sum is not set in it has no solution, so it is cut
+def reachableSums(candidates, target):
+    mask = (1<<(target+1))-1
+    reach = [0]*(len(candidates)+1)
+    reach[-1] = r = 1
+    for i in range(len(candidates)-1, -1, -1):
+        r = (r | (r<<candidates[i])) & mask
+        reach[i] = r
+    return reach
+
 def combinationSum2(candidates, target):
     candidates.sort()
     result = []
+    path = []
+    reach = reachableSums(candidates, target)
 
-    def backtrack(start, path, remaining):
+    def backtrack(start, remaining):
         if remaining == 0:
-            result.append(path)
+            result.append(path.copy())
             return
-        if remaining < 0:
+        if remaining < 0 or not (reach[start]>>remaining) & 1:
             return
 
         for i in range(start, len(candidates)):
             if i > start and candidates[i] == candidates[i - 1]:
                 continue
-            backtrack(i + 1, path + [candidates[i]], remaining - candidates[i])
+            path.append(candidates[i])
+            backtrack(i + 1, remaining - candidates[i])
+            path.pop()
 
-    backtrack(0, [], target)
+    backtrack(0, target)
     return result
-print(combinationSum2([10,1,2,7,6,1,5], 8))
\ No newline at end of file
+
+if __name__=='__main__':
+    print(combinationSum2([10,1,2,7,6,1,5], 8))
@@ -1,27 +1,53 @@
 def findWords(board, words):
-    def backtrack(i, j, node, path):
-        if '#' in node:
-            result.add(path)
-        if not (0 <= i < len(board)) or not (0 <= j < len(board[0])):
-            return
-        temp = board[i][j]
-        if temp not in node:
-            return
-        board[i][j] = '@'  # mark as visited
-        for x, y in [(i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)]:
-            backtrack(x, y, node[temp], path + temp)
-        board[i][j] = temp  # unmark
+    ROWS, COLS = len(board), len(board[0])
+    # every letter that appears in the words gets a bit, board letters outside of them get the
+    # spare id `width`, which is never set in any mask
+    letters = {ch: k for k, ch in enumerate(sorted(set(''.join(words))))}
+    width = len(letters)
 
-    trie = {}
+    # trie as parallel lists: children[n][k] is the child of node n for letter k (0 = none, the root
+    # is never a child), mask[n] has bit k set when that child exists, end[n] is the word ending there
+    children = [[0]*width]
+    mask = [0]
+    end = [None]
     for word in words:
-        node = trie
-        for char in word:
-            node = node.setdefault(char, {})
-        node['#'] = True  # end of a word
+        node = 0
+        for ch in word:
+            k = letters[ch]
+            if not children[node][k]:
+                children[node][k] = len(children)
+                mask[node] |= 1 << k
+                children.append([0]*width)
+                mask.append(0)
+                end.append(None)
+            node = children[node][k]
+        end[node] = word  # end of a word, kept whole so the search never rebuilds it
+
+    # board flattened to cell ids, each with its letter id and its in-bounds neighbours
+    codes = [letters.get(ch, width) for row in board for ch in row]
+    neighbours = []
+    for i in range(ROWS):
+        for j in range(COLS):
+            neighbours.append([x*COLS + y for x, y in [(i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)]
+                               if 0 <= x < ROWS and 0 <= y < COLS])
+
+    # used is a bitmap of the cells on the current path, in place of writing '@' into the board
+    def backtrack(cell, node, used):
+        node = children[node][codes[cell]]
+        if end[node] is not None:
+            result.add(end[node])
+            end[node] = None  # found once is enough
+        used |= 1 << cell
+        m = mask[node]
+        for nb in neighbours[cell]:
+            if not (used >> nb) & 1 and (m >> codes[nb]) & 1:
+                backtrack(nb, node, used)
 
     result = set()
-    for i in range(len(board)):
-        for j in range(len(board[0])):
-            backtrack(i, j, trie, '')
+    if end[0] is not None:
+        result.add(end[0])
+    for cell in range(ROWS*COLS):
+        if (mask[0] >> codes[cell]) & 1:
+            backtrack(cell, 0, 0)
 
-    return list(result)
\ No newline at end of file
+    return list(result)
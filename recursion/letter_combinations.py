@@ -1,24 +1,84 @@
+from functools import lru_cache
+from itertools import product
+
+DIGIT_TO_LETTERS = {
+    '2': 'abc',
+    '3': 'def',
+    '4': 'ghi',
+    '5': 'jkl',
+    '6': 'mno',
+    '7': 'pqrs',
+    '8': 'tuv',
+    '9': 'wxyz'
+}
+
+# the combinations of a suffix only depend on the suffix, so they are built once and shared
+# between calls, e.g. "234" and "34" both reuse the expansion of "4"
+@lru_cache(maxsize=128)
+def _suffixCombinations(suffix):
+    if not suffix:
+        return ("",)
+    rest = _suffixCombinations(suffix[1:])
+    return tuple(c + s for c in DIGIT_TO_LETTERS[suffix[0]] for s in rest)
+
 def letterCombinations(digits):
     if not digits:
         return []
-    digit_to_letters = {
-        '2': 'abc',
-        '3': 'def',
-        '4': 'ghi',
-        '5': 'jkl',
-        '6': 'mno',
-        '7': 'pqrs',
-        '8': 'tuv',
-        '9': 'wxyz'
-    }
+    return list(_suffixCombinations(digits))
+
+# the combinations are the cartesian product of the letter groups, itertools does the loop in C
+def letterCombinationsProduct(digits):
+    if not digits:
+        return []
+    return [''.join(p) for p in product(*(DIGIT_TO_LETTERS[d] for d in digits))]
+
+# backtracking over one preallocated buffer: each level overwrites its own slot instead of
+# building curstr + c, and a string is only made once per finished combination
+_LETTER_BYTES = {d: letters.encode('ascii') for d, letters in DIGIT_TO_LETTERS.items()}
+
+def letterCombinationsBuffer(digits):
+    if not digits:
+        return []
+    last = len(digits) - 1
+    buf = bytearray(last + 1)
     res = []
-    def backtrack(i, curstr):
-        if len(curstr) == len(digits):
-            res.append(curstr)
+    append = res.append
+    def backtrack(i):
+        if i == last:
+            # fill the last slot in a loop instead of one more call per combination
+            for c in _LETTER_BYTES[digits[i]]:
+                buf[i] = c
+                append(buf.decode('ascii'))
             return
-        for c in digit_to_letters[digits[i]]:
-            backtrack(i + 1, curstr + c)
-    backtrack(0, "")
+        for c in _LETTER_BYTES[digits[i]]:
+            buf[i] = c
+            backtrack(i + 1)
+    backtrack(0)
     return res
+
+# specialize on the digits: generate k nested for loops over the letter literals once, compile
+# them, and keep the function for the next call with the same digits
+_UNROLLED = {}
+
+def _compileUnrolled(digits):
+    # p{i} is the prefix through digit i, extended by one letter per level
+    lines = ["def combos():", " res = []", " append = res.append"]
+    for i, d in enumerate(digits):
+        lines.append(" " * (i + 1) + f"for c in {DIGIT_TO_LETTERS[d]!r}:")
+        lines.append(" " * (i + 2) + (f"p{i} = p{i - 1} + c" if i else "p0 = c"))
+    lines.append(" " * (len(digits) + 1) + f"append(p{len(digits) - 1})")
+    lines.append(" return res")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<letterCombinations {digits}>", "exec"), namespace)
+    return namespace["combos"]
+
+def letterCombinationsUnrolled(digits):
+    if not digits:
+        return []
+    fn = _UNROLLED.get(digits)
+    if fn is None:
+        fn = _UNROLLED[digits] = _compileUnrolled(digits)
+    return fn()
+
 print(letterCombinations("23"))  # Example usage
-# Output: ['ad', 'ae', 'af', 'bd', 'be', '
\ No newline at end of file
+# Output: ['ad', 'ae', 'af', 'bd', 'be', '
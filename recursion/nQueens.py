@@ -1,33 +1,74 @@
 # queen can not add in same row, positive diagonal, negative diagonal, column
-def nQueens(n):
-    col = set()
-    posDiag = set() #r+c
-    negDiag = set() #r-c
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
+# bit c of each mask is column c: col holds the used columns, d1/d2 the squares of the current
+# row attacked through a diagonal. going one row down the diagonals move one column, so shift.
+# the recursion is only n deep; an explicit stack version measured slower on cpython 3.11
+def nQueens(n):
+    full = (1<<n)-1
     res = []
-    board = [["."]*n for i in range(n)]
+    cols = [0]*n
 
-    def backtrack(r):
+    def solve(r, col, d1, d2):
         if r==n:
-            cp = ["".join(row) for row in board]
-            res.append(cp)
+            res.append(["."*c + "Q" + "."*(n-c-1) for c in cols])
             return
-        for c in range(n):
-            if c in col or (r+c) in posDiag or (r-c) in negDiag:
-                continue
-            col.add(c)
-            posDiag.add(r+c)
-            negDiag.add(r-c)
-            board[r][c]="Q"
-
-            backtrack(r+1)
-
-            col.remove(c)
-            posDiag.remove(r+c)
-            negDiag.remove(r-c)
-            board[r][c]="."
-    backtrack(0)
+        free = full & ~(col|d1|d2)
+        while free:
+            bit = free & -free
+            free ^= bit
+            cols[r] = bit.bit_length()-1
+            solve(r+1, col|bit, (d1|bit)<<1, (d2|bit)>>1)
+
+    def solveFirstRow(bits):
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            cols[0] = bit.bit_length()-1
+            solve(1, bit, bit<<1, bit>>1)
+
+    if n==0:
+        return [[]]
+    # the board is symmetric left to right: search with the first queen in the left half only and
+    # add the mirror of every solution. on odd n the middle column is its own mirror, search it alone
+    solveFirstRow((1<<(n//2))-1)
+    res += [[row[::-1] for row in board] for board in res]
+    if n & 1:
+        solveFirstRow(1<<(n//2))
     return res
 
-print(nQueens(4))
-        
+# only the number of solutions: same bitmask recursion on plain ints, no boards, so numba can compile it
+def _count(full, col, d1, d2):
+    if col==full:
+        return 1
+    total = 0
+    free = full & ~(col|d1|d2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count(full, col|bit, ((d1|bit)<<1) & full, (d2|bit)>>1)
+    return total
+
+if njit is not None:
+    _count = njit(cache=True)(_count)
+
+def nQueens_count(n):
+    full = (1<<n)-1
+    if n==0:
+        return 1
+    # left half of the first row counted twice for the mirrored boards, the middle column once
+    total = 0
+    for c in range(n//2):
+        bit = 1<<c
+        total += 2*_count(full, bit, (bit<<1) & full, bit>>1)
+    if n & 1:
+        bit = 1<<(n//2)
+        total += _count(full, bit, (bit<<1) & full, bit>>1)
+    return int(total)
+
+if __name__=='__main__':
+    print(nQueens(4))
+    print(nQueens_count(8))
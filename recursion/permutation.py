@@ -1,15 +1,26 @@
-def permutation(nums):
-    if len(nums)==0:
-        return [[]]
-    
-    perms = permutation(nums[1:])
+# heap's algorithm: every next permutation is one swap away from the previous one, so only
+# one working list is changed and each output is a single snapshot copy of it
+def heaps(nums):
+    a = list(nums)
+    n = len(a)
+    c = [0]*n
+    yield a[:]
+    i = 1
+    while i < n:
+        ci = c[i]
+        if ci < i:
+            # odd i swaps with position c[i], even i always with the first element
+            j = ci if i & 1 else 0
+            a[j], a[i] = a[i], a[j]
+            yield a[:]
+            c[i] = ci + 1
+            i = 1
+        else:
+            c[i] = 0
+            i += 1
 
-    res = []
-    for p in perms:
-        for i in range(len(p)+1):
-            p_copy = p.copy()
-            p_copy.insert(i, nums[0])
-            res.append(p_copy)
-    return res
+def permutation(nums):
+    return list(heaps(nums))
 
-print(permutation([1,2,3]))
\ No newline at end of file
+if __name__=='__main__':
+    print(permutation([1,2,3]))
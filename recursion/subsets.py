@@ -1,19 +1,13 @@
+# subset number `mask` holds nums[i] for every bit i set in mask. the subsets are filled in as a
+# table indexed by mask: adding bit h to every smaller mask is the old subset plus nums[h], so
+# each subset costs one list copy and there is no recursion
 def subsets(nums):
-    if not nums:
-        return [[]]
-    
-    first_element = nums[0]
-    rest_element = nums[1:]
-
-    subset_without_first = subsets(rest_element)
-
-    subset_with_first = []
-
-    for set in subset_without_first:
-        subset_with_first.append([first_element] +set)
-    return subset_without_first + subset_with_first
-
-print(subsets([2,3,6,7]))
+    res = [[]]*(1<<len(nums))
+    for h, num in enumerate(nums):
+        base = 1<<h
+        x = [num]
+        res[base:base<<1] = [s + x for s in res[:base]]
+    return res
 
 def subsets_iterative(nums):
     result = [[]]
@@ -21,4 +15,7 @@ def subsets_iterative(nums):
     for num in nums:
         result += [curr + [num] for curr in result]
     return result
-print(subsets_iterative([2,3,6,7]))
\ No newline at end of file
+
+if __name__=='__main__':
+    print(subsets([2,3,6,7]))
+    print(subsets_iterative([2,3,6,7]))
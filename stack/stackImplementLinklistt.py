@@ -6,8 +6,10 @@ class Node:
         self.next = next
 
 class StackLinkList:
-    def __init__(self):
+    # debug=True prints every push/pop, off by default so they only do the stack work
+    def __init__(self, debug=False):
         self.head = None
+        self.debug = debug
 
     def isEmpty(self):
         return True if self.head is None else False
@@ -15,15 +17,17 @@ class StackLinkList:
         node = Node(data)
         node.next = self.head
         self.head = node
-        print(f'{data} pushed in the stack')
+        if self.debug:
+            print(f'{data} pushed in the stack')
         return
     def pop(self):
         if self.isEmpty():
             return float('-inf')
         temp = self.head
         self.head = self.head.next
-        print(f'{temp.data} is poped')
-        return
+        if self.debug:
+            print(f'{temp.data} is poped')
+        return temp.data
     def peek(self):
         if self.isEmpty():
             return float('-inf')
@@ -42,7 +46,7 @@ class StackLinkList:
         return
     
 if __name__=='__main__':
-    stack = StackLinkList()
+    stack = StackLinkList(debug=True)
     stack.push(10)
     stack.push(20)
     stack.push(30)
@@ -1,4 +1,8 @@
+from collections import deque
+
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -30,12 +34,31 @@ class TreeNode():
 
         return elements
 
-def insert_data(arr):
+# copy of the tree with the nodes allocated in level order, so a parent and its children are
+# created close together instead of in insert order. one BFS walks the original and its copy in
+# step, each child is copied as its parent is dequeued
+def relayout(root):
+    if root is None:
+        return None
+    new_root = TreeNode(root.data)
+    q = deque([(root, new_root)])
+    while q:
+        node, copy = q.popleft()
+        if node.left:
+            copy.left = TreeNode(node.left.data)
+            q.append((node.left, copy.left))
+        if node.right:
+            copy.right = TreeNode(node.right.data)
+            q.append((node.right, copy.right))
+    return new_root
+
+# with level_order=True the finished tree is replaced by its relayout copy
+def insert_data(arr, level_order=False):
     root = TreeNode(arr[0])
     for val in arr[1:]:
         root.add_child(val)
-    return root
+    return relayout(root) if level_order else root
 if __name__ == '__main__':
     data = [15,12,20,8,13,17,27,7,9,12,14]
-    build_tree = insert_data(data)
+    build_tree = insert_data(data, level_order=True)
     print(build_tree.level_order_traversal([],0))
\ No newline at end of file
@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data=0):
         self.data = data
         self.left = None
@@ -22,11 +24,10 @@ def buildTree(preorder, inorder):
 def printTree(root):
     data = []
     def dfs(root):
-        if not root:
-            return
-        dfs(root.left)
-        data.append(root.data)
-        dfs(root.right)
+        while root:
+            dfs(root.left)
+            data.append(root.data)
+            root = root.right
     dfs(root)
     return data
 x = buildTree([3,9,20,15,7],[9,3,15,20,7])
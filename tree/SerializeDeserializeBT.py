@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -20,13 +22,14 @@ class TreeNode():
     
 def serialize(root):
     result = []
+    # the right subtree is the next pass of the loop instead of a call; the 'N' after the loop
+    # marks the empty right child the walk ended on
     def dfs(node):
-        if not node:
-            result.append('N')
-            return
-        result.append(str(node.data))
-        dfs(node.left)
-        dfs(node.right)
+        while node:
+            result.append(str(node.data))
+            dfs(node.left)
+            node = node.right
+        result.append('N')
     dfs(root)
     return ','.join(result)
 
@@ -46,11 +49,10 @@ def deserialize(data):
     return dfs()
         
 def print_tree(root):
-    if not root:
-        return
-    print(root.data, end=' ')
-    print_tree(root.left)
-    print_tree(root.right)
+    while root:
+        print(root.data, end=' ')
+        print_tree(root.left)
+        root = root.right
 
 def insert_data(arr):
     root = TreeNode(arr[0])
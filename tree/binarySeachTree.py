@@ -1,6 +1,8 @@
 #create a binary search tree
 
 class BinaryTree:
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.left=None
         self.right=None
@@ -24,63 +26,59 @@ class BinaryTree:
     #left -> root -> right
     def inorder_traversal(self, root):
         data = []
+        #recurse left, loop right
         def dfs(root):
-            if not root:
-                return
-            dfs(root.left)
-            data.append(root.data)
-            dfs(root.right)
+            while root:
+                dfs(root.left)
+                data.append(root.data)
+                root = root.right
         dfs(root)
         return data
-        # if root:
-        #     data = self.inorder_traversal(root.left)
-        #     #print(root.data)
-        #     data.append(root.data)
-        #     data = data + self.inorder_traversal(root.right)
-        # return data
     
     #root -> left -> right
+    # every call appends to the one shared list instead of returning a list for the parent to copy
     def preorder_traversal(self,root):
         data = []
-        if root:
-            data.append(root.data)
-            #print(root.data)
-            data = data + self.preorder_traversal(root.left)
-            data = data + self.preorder_traversal(root.right)
+        def dfs(root):
+            while root:
+                data.append(root.data)
+                dfs(root.left)
+                root = root.right
+        dfs(root)
         return data
     #letf -> right -> root
     def postorder_traversal(self,root):
         data = []
-        if root:
-            data = self.postorder_traversal(root.left)
-            data = data + self.postorder_traversal(root.right)
+        def dfs(root):
+            if not root:
+                return
+            dfs(root.left)
+            dfs(root.right)
             data.append(root.data)
-            #print(root.data)
+        dfs(root)
         return data
     
+    # loops instead of tail calls, one step down per iteration and no python frame per level
     def find_value(self, val):
-        if self.data==val:
-            print(f'{ val} is found')
-            return True
-        if val< self.data:
-            if self.left is None:
-                print(f'{val} is Not found')
-                return False
-            self.left.find_value(val)
-        if val> self.data:
-            if self.right is None:
-                print(f'{val} is not found')
-                return False
-            self.right.find_value(val)
+        node = self
+        while node is not None:
+            if node.data==val:
+                print(f'{ val} is found')
+                return True
+            node = node.left if val< node.data else node.right
+        print(f'{val} is not found')
+        return False
 
     def find_max(self):
-        if self.right is None:
-            return self.data
-        return self.right.find_max()
+        node = self
+        while node.right is not None:
+            node = node.right
+        return node.data
     def find_min(self):
-        if self.left is None:
-            return self.data
-        return self.left.find_min()
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node.data
 
     def delete_value(self, value):
         if value < self.data:
@@ -102,12 +100,12 @@ class BinaryTree:
     
 def printTree(root):
     tree_data = []
-    if root:
-        if root.left:
-            tree_data = printTree(root.left)
-        tree_data.append(root.data)
-        if root.right:
-            tree_data += printTree(root.right)
+    def dfs(root):
+        while root:
+            dfs(root.left)
+            tree_data.append(root.data)
+            root = root.right
+    dfs(root)
     return tree_data
 
 if __name__=='__main__':
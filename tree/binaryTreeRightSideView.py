@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -21,10 +23,13 @@ class TreeNode():
 def rightSideView(root, res, level):
     if not root:
         return []
-    if len(res)== level:
-        res.append(root.data)
-    rightSideView(root.right, res, level+1)
-    rightSideView(root.left, res, level+1)
+    # the left subtree is visited last, so it is the next pass of the loop instead of a call
+    while root:
+        if len(res)== level:
+            res.append(root.data)
+        rightSideView(root.right, res, level+1)
+        root = root.left
+        level += 1
     return res
     
         
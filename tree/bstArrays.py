@@ -0,0 +1,456 @@
+# binary search tree stored as parallel arrays instead of TreeNode objects: node i has its value
+# in data[i] and the index of its children in left[i]/right[i], -1 for no child. one node costs
+# 16 bytes of array storage instead of a python object with three attributes, and the nodes
+# sit next to each other in memory. values are int64, the same insert rules as add_child
+# (duplicates and None are skipped)
+from array import array
+try:
+    import numpy as np
+    import numba
+    from numba import njit, prange, get_num_threads, set_num_threads
+except ImportError:
+    np = None
+    prange = range
+
+class BSTArrays():
+    def __init__(self):
+        self.data = array('q')
+        self.left = array('i')
+        self.right = array('i')
+
+    def __len__(self):
+        return len(self.data)
+
+    def add_child(self, value):
+        if value is None:
+            return
+        data, left, right = self.data, self.left, self.right
+        new = len(data)
+        if new == 0:
+            data.append(value)
+            left.append(-1)
+            right.append(-1)
+            return
+        i = 0
+        while True:
+            v = data[i]
+            if value == v:
+                return
+            side = left if value < v else right
+            nxt = side[i]
+            if nxt == -1:
+                side[i] = new
+                break
+            i = nxt
+        data.append(value)
+        left.append(-1)
+        right.append(-1)
+
+    #left -> root -> right
+    def inorder(self):
+        data, left, right = self.data, self.left, self.right
+        elements = array('q')
+        stack = []
+        i = 0 if data else -1
+        while stack or i != -1:
+            if i != -1:
+                stack.append(i)
+                i = left[i]
+            else:
+                i = stack.pop()
+                elements.append(data[i])
+                i = right[i]
+        return elements
+
+    #root -> left -> right
+    def preorder(self):
+        data, left, right = self.data, self.left, self.right
+        elements = array('q')
+        stack = [0] if data else []
+        while stack:
+            i = stack.pop()
+            elements.append(data[i])
+            if right[i] != -1:
+                stack.append(right[i])
+            if left[i] != -1:
+                stack.append(left[i])
+        return elements
+
+    #left -> right -> root, collected as root -> right -> left and reversed
+    def post_order(self):
+        data, left, right = self.data, self.left, self.right
+        elements = array('q')
+        stack = [0] if data else []
+        while stack:
+            i = stack.pop()
+            elements.append(data[i])
+            if left[i] != -1:
+                stack.append(left[i])
+            if right[i] != -1:
+                stack.append(right[i])
+        elements.reverse()
+        return elements
+
+    def depth_of_tree(self):
+        left, right = self.left, self.right
+        level = [0] if self.data else []
+        depth = 0
+        while level:
+            depth += 1
+            level = [c for i in level for c in (left[i], right[i]) if c != -1]
+        return depth
+
+    def find_value(self, value):
+        data, left, right = self.data, self.left, self.right
+        i = 0 if data else -1
+        while i != -1:
+            v = data[i]
+            if v == value:
+                return True
+            i = left[i] if value < v else right[i]
+        return False
+
+    def kth_smallest(self, k):
+        data, left, right = self.data, self.left, self.right
+        stack = []
+        i = 0 if data else -1
+        while stack or i != -1:
+            if i != -1:
+                stack.append(i)
+                i = left[i]
+            else:
+                i = stack.pop()
+                k -= 1
+                if k == 0:
+                    return data[i]
+                i = right[i]
+        raise IndexError('k is larger than the number of nodes')
+
+    # object tree with the same shape, only for code that needs TreeNode objects
+    def to_tree(self):
+        if not self.data:
+            return None
+        nodes = [TreeNode(v) for v in self.data]
+        for i, node in enumerate(nodes):
+            if self.left[i] != -1:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != -1:
+                node.right = nodes[self.right[i]]
+        return nodes[0]
+
+# numeric kernels over the three arrays, compiled with numba when it is installed. they take
+# their stack/output buffers from the caller so the same code runs on array.array without numpy
+def _inorder_soa(data, left, right, stack, out):
+    top = 0
+    n = 0
+    i = 0 if len(data) > 0 else -1
+    while top > 0 or i != -1:
+        if i != -1:
+            stack[top] = i
+            top += 1
+            i = left[i]
+        else:
+            top -= 1
+            i = stack[top]
+            out[n] = data[i]
+            n += 1
+            i = right[i]
+    return n
+
+# lo/hi hold the index of the node that bounds the value from below/above, -1 for no bound
+def _is_valid_soa(data, left, right, stack, lo, hi):
+    if len(data) == 0:
+        return True
+    top = 1
+    stack[0] = 0
+    lo[0] = -1
+    hi[0] = -1
+    while top > 0:
+        top -= 1
+        i, l, h = stack[top], lo[top], hi[top]
+        v = data[i]
+        if (l != -1 and v <= data[l]) or (h != -1 and v >= data[h]):
+            return False
+        if left[i] != -1:
+            stack[top], lo[top], hi[top] = left[i], l, i
+            top += 1
+        if right[i] != -1:
+            stack[top], lo[top], hi[top] = right[i], i, h
+            top += 1
+    return True
+
+def _depth_soa(left, right, stack, depths):
+    if len(left) == 0:
+        return 0
+    top = 1
+    stack[0] = 0
+    depths[0] = 1
+    best = 0
+    while top > 0:
+        top -= 1
+        i, d = stack[top], depths[top]
+        if d > best:
+            best = d
+        if left[i] != -1:
+            stack[top], depths[top] = left[i], d + 1
+            top += 1
+        if right[i] != -1:
+            stack[top], depths[top] = right[i], d + 1
+            top += 1
+    return best
+
+# index of the kth smallest value, -1 when the tree has fewer than k nodes
+def _kth_smallest_soa(left, right, stack, k):
+    top = 0
+    i = 0 if len(left) > 0 else -1
+    while top > 0 or i != -1:
+        if i != -1:
+            stack[top] = i
+            top += 1
+            i = left[i]
+        else:
+            top -= 1
+            i = stack[top]
+            k -= 1
+            if k == 0:
+                return i
+            i = right[i]
+    return -1
+
+# post-order without recursion: a node is pushed as i to schedule its children and as ~i to be
+# finished after them, heights[i] is filled once both children are done
+def _is_balanced_soa(left, right, stack, heights):
+    if len(left) == 0:
+        return True
+    top = 1
+    stack[0] = 0
+    while top > 0:
+        top -= 1
+        i = stack[top]
+        if i >= 0:
+            stack[top] = ~i
+            top += 1
+            if right[i] != -1:
+                stack[top] = right[i]
+                top += 1
+            if left[i] != -1:
+                stack[top] = left[i]
+                top += 1
+        else:
+            i = ~i
+            hl = heights[left[i]] if left[i] != -1 else 0
+            hr = heights[right[i]] if right[i] != -1 else 0
+            if hl - hr > 1 or hr - hl > 1:
+                return False
+            heights[i] = (hl if hl > hr else hr) + 1
+    return True
+
+# builds the tree of values[start:stop] in one pass, the same descent as add_child but on plain
+# ints in preallocated arrays. nodes go to data[base:], child links are absolute indices. returns
+# how many nodes were used (duplicates take no slot)
+def _build_soa(values, start, stop, data, left, right, base):
+    n = 0
+    for k in range(start, stop):
+        v = values[k]
+        if n == 0:
+            data[base], left[base], right[base] = v, -1, -1
+            n = 1
+            continue
+        i = base
+        while True:
+            d = data[i]
+            if v == d:
+                break
+            if v < d:
+                if left[i] == -1:
+                    left[i] = base + n
+                    break
+                i = left[i]
+            else:
+                if right[i] == -1:
+                    right[i] = base + n
+                    break
+                i = right[i]
+        if v != data[i]:
+            data[base + n], left[base + n], right[base + n] = v, -1, -1
+            n += 1
+    return n
+
+# every bucket is an independent subtree: its values sit in values[vstarts[b]:vstarts[b+1]] and
+# its nodes in data[bases[b]:], so the buckets never touch each other's slots and run in parallel
+def _build_buckets_soa(values, vstarts, bases, data, left, right, used):
+    for b in prange(len(bases)):
+        used[b] = _build_soa(values, vstarts[b], vstarts[b + 1], data, left, right, bases[b])
+
+# moves the buckets down over the slots their duplicates left empty, bases[b] is updated to where
+# bucket b starts now; returns the number of nodes
+def _compact_soa(data, left, right, bases, used):
+    dst = bases[0]
+    for b in range(len(bases)):
+        shift = bases[b] - dst
+        for j in range(used[b]):
+            src = bases[b] + j
+            data[dst + j] = data[src]
+            left[dst + j] = left[src] - shift if left[src] != -1 else -1
+            right[dst + j] = right[src] - shift if right[src] != -1 else -1
+        bases[b] = dst
+        dst += used[b]
+    return dst
+
+if np is not None:
+    _build_soa = njit(cache=True)(_build_soa)
+    _build_buckets_soa = njit(cache=True, parallel=True)(_build_buckets_soa)
+    _compact_soa = njit(cache=True)(_compact_soa)
+    _inorder_soa = njit(cache=True)(_inorder_soa)
+    _is_valid_soa = njit(cache=True)(_is_valid_soa)
+    _depth_soa = njit(cache=True)(_depth_soa)
+    _kth_smallest_soa = njit(cache=True)(_kth_smallest_soa)
+    _is_balanced_soa = njit(cache=True)(_is_balanced_soa)
+
+    # zero copy numpy views of the arrays, only held for the duration of one call since an
+    # array.array can not grow while a view of it exists
+    def _views(tree):
+        return (np.frombuffer(tree.data, dtype=np.int64), np.frombuffer(tree.left, dtype=np.int32),
+                np.frombuffer(tree.right, dtype=np.int32))
+
+    def _buffer(n, typecode='i'):
+        return np.empty(n, dtype=np.int64 if typecode == 'q' else np.int32)
+
+    def _below(values, v):
+        return values[values < v]
+
+    def _above(values, v):
+        return values[values > v]
+
+    def _concat(parts):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+else:
+    def _views(tree):
+        return tree.data, tree.left, tree.right
+
+    def _buffer(n, typecode='i'):
+        return array(typecode, [0])*n
+
+def inorder_soa(tree):
+    data, left, right = _views(tree)
+    out = _buffer(len(tree), 'q')
+    _inorder_soa(data, left, right, _buffer(len(tree)), out)
+    return out.tolist()
+
+def is_valid_soa(tree):
+    data, left, right = _views(tree)
+    n = len(tree)
+    return bool(_is_valid_soa(data, left, right, _buffer(n), _buffer(n), _buffer(n)))
+
+def depth_soa(tree):
+    _, left, right = _views(tree)
+    n = len(tree)
+    return int(_depth_soa(left, right, _buffer(n), _buffer(n)))
+
+def kth_smallest_soa(tree, k):
+    _, left, right = _views(tree)
+    i = int(_kth_smallest_soa(left, right, _buffer(len(tree)), k))
+    if i == -1:
+        raise IndexError('k is larger than the number of nodes')
+    return tree.data[i]
+
+def is_balanced_soa(tree):
+    _, left, right = _views(tree)
+    n = len(tree)
+    return bool(_is_balanced_soa(left, right, _buffer(n), _buffer(n)))
+
+class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+
+# below this many values the partitioning costs more than the parallel build saves
+_PARALLEL_MIN = 1 << 15
+
+# the first `levels` levels of the tree, built by splitting the values around the first value of
+# each range like a sequential insert would. a range left over at the bottom is a bucket: the
+# subtree under skeleton node `parent`, holding its values in their original order
+def _split(values, levels, skeleton, buckets, parent=-1, is_left=False):
+    if len(values) == 0:
+        return
+    if levels == 0:
+        buckets.append((parent, is_left, values))
+        return
+    i = len(skeleton)
+    skeleton.append([values[0], -1, -1])
+    if parent != -1:
+        skeleton[parent][1 if is_left else 2] = i
+    _split(_below(values, values[0]), levels - 1, skeleton, buckets, i, True)
+    _split(_above(values, values[0]), levels - 1, skeleton, buckets, i, False)
+
+# builds each bucket's subtree in parallel after the skeleton, then links the bucket roots into
+# the skeleton. gives the same tree as inserting the values one by one, with the nodes numbered
+# skeleton first and then bucket by bucket
+def _build_parallel(values, data, left, right, levels):
+    skeleton, buckets = [], []
+    _split(values, levels, skeleton, buckets)
+    s = len(skeleton)
+    for i, (v, l, r) in enumerate(skeleton):
+        data[i], left[i], right[i] = v, l, r
+    if not buckets:
+        return s
+    vstarts, bases = _buffer(len(buckets) + 1), _buffer(len(buckets))
+    vstarts[0] = 0
+    for b, (_, _, part) in enumerate(buckets):
+        vstarts[b + 1] = vstarts[b] + len(part)
+        bases[b] = s + vstarts[b]
+    used = _buffer(len(buckets))
+    _build_buckets_soa(_concat([part for _, _, part in buckets]), vstarts, bases, data, left, right, used)
+    n = _compact_soa(data, left, right, bases, used)
+    for b, (parent, is_left, _) in enumerate(buckets):
+        if used[b]:
+            (left if is_left else right)[parent] = bases[b]
+    return n
+
+# with numba, a large input is built as parallel subtrees: threads sets how many numba threads
+# build them (at most NUMBA_NUM_THREADS, numba's own setting is restored afterwards), and there
+# are about two buckets per thread. without numba there is nothing to run in parallel, so every
+# input takes the single pass
+def insert_data(arr, threads=None):
+    values = [val for val in arr if val is not None]
+    m = len(values)
+    data, left, right = _buffer(m, 'q'), _buffer(m), _buffer(m)
+    # non-integers are rejected rather than truncated: array('q') raises TypeError for them, the
+    # numpy path checks the dtype numpy infers before casting
+    if np is not None:
+        values = np.asarray(values)
+        if m and values.dtype.kind not in 'iu':
+            raise TypeError('BSTArrays values must be integers, got %s' % values.dtype)
+        values = values.astype(np.int64, copy=False)
+    else:
+        values = array('q', values)
+    if np is not None and m >= _PARALLEL_MIN:
+        previous = get_num_threads()
+        if threads:
+            set_num_threads(max(1, min(threads, numba.config.NUMBA_NUM_THREADS)))
+        try:
+            # `levels` levels give up to 2**levels buckets, 2**bit_length is at most 2*threads
+            n = _build_parallel(values, data, left, right, get_num_threads().bit_length())
+        finally:
+            set_num_threads(previous)
+    else:
+        n = _build_soa(values, 0, m, data, left, right, 0)
+    tree = BSTArrays()
+    tree.data.frombytes(bytes(data[:n]))
+    tree.left.frombytes(bytes(left[:n]))
+    tree.right.frombytes(bytes(right[:n]))
+    return tree
+
+if __name__ == '__main__':
+    data = [15,12,20,8,13,17,27,7,9,12,14]
+    build_tree = insert_data(data)
+    print(build_tree.inorder().tolist())
+    print(build_tree.preorder().tolist())
+    print(build_tree.post_order().tolist())
+    print(build_tree.depth_of_tree())
+    print(build_tree.kth_smallest(3), build_tree.find_value(13), build_tree.find_value(16))
+    print(inorder_soa(build_tree), depth_soa(build_tree), kth_smallest_soa(build_tree, 3),
+          is_valid_soa(build_tree), is_balanced_soa(build_tree))
@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
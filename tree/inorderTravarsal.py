@@ -1,4 +1,8 @@
+from array import array
+
 class BinarySearchTreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self,data):
         self.data = data
         self.left = None
@@ -20,18 +24,36 @@ class BinarySearchTreeNode():
     
     #left -> root -> right
     def inorder(self):
-        elements = []
-        
-        #traverse left
-        if self.left:
-            elements += self.left.inorder()
-        #traverse root
-        elements.append(self.data)
-        #traverse right
-        if self.right:
-            elements += self.right.inorder()
-        
+        # explicit stack instead of recursion: one output array, no list per node to concatenate
+        elements = array('q')
+        stack = []
+        node = self
+        while stack or node:
+            if node:
+                #traverse left first, remember the way back
+                stack.append(node)
+                node = node.left
+            else:
+                #traverse root, then its right subtree
+                node = stack.pop()
+                elements.append(node.data)
+                node = node.right
+
         return elements
+
+    # same walk as inorder, but yields the values one at a time so a caller that stops early
+    # never builds the list; holds at most one stack entry per level
+    def inorder_iter(self):
+        stack = []
+        node = self
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.data
+                node = node.right
     
 def insert_data(arr):
     root = BinarySearchTreeNode(arr[0])
@@ -41,6 +63,6 @@ def insert_data(arr):
 if __name__ == '__main__':
     data = [15,12,20,8,13,17,27,7,9,12,14]
     build_tree = insert_data(data)
-    print(build_tree.inorder())
+    print(build_tree.inorder().tolist())
 
 
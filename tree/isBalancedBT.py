@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -18,18 +20,38 @@ class TreeNode():
             else:
                 self.right = TreeNode(data)
     
+# one iterative post-order gives both answers: a node is pushed once to schedule its children and
+# once more to be finished after them. heights keeps the height of finished subtrees by id(node)
+# until the parent reads it (an empty child is not in it and counts as 0). returns
+# (is_balanced, depth); with stop_early the first unbalanced node ends the walk and the depth
+# returned is None, otherwise the walk goes on so the depth is always complete
+def balance_and_depth(root, stop_early=True):
+    heights = {}
+    balanced = True
+    stack = [(root, False)] if root else []
+    while stack:
+        curr, children_done = stack.pop()
+        if children_done:
+            left_depth = heights.pop(id(curr.left), 0)
+            right_depth = heights.pop(id(curr.right), 0)
+            if abs(left_depth-right_depth)>1:
+                if stop_early:
+                    return False, None
+                balanced = False
+            heights[id(curr)] = max(left_depth, right_depth) + 1
+        else:
+            stack.append((curr, True))
+            if curr.right:
+                stack.append((curr.right, False))
+            if curr.left:
+                stack.append((curr.left, False))
+    return balanced, heights.get(id(root), 0)
+
 def isBalanced(root):
-    
-    def dfs(curr):
-        if not curr:
-            return [True,0]
-        left_depth = dfs(curr.left)
-        right_depth = dfs(curr.right)
-        diff = left_depth[0] and right_depth[0] and abs(left_depth[1]-right_depth[1])<=1
-        return [diff,max(left_depth[1], right_depth[1]) + 1]
-    
-    return dfs(root)[0]
-        
+    return balance_and_depth(root)[0]
+
+def depth_of_tree(root):
+    return balance_and_depth(root, stop_early=False)[1]
 
 
 def insert_data(arr):
@@ -40,4 +62,5 @@ def insert_data(arr):
 if __name__ == '__main__':
     data = [1,None,2,None,3] #[15,12,20,8,13,17,27,7,9,12,14]
     build_tree = insert_data(data)
-    print(isBalanced(build_tree))
\ No newline at end of file
+    print(isBalanced(build_tree))
+    print(balance_and_depth(build_tree, stop_early=False))
\ No newline at end of file
@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -18,13 +20,18 @@ class TreeNode():
             else:
                 self.right = TreeNode(data)
 
+# both trees are walked in lockstep from one stack of (p, q) pairs instead of two recursive calls
 def isSameTree(p, q) -> bool:
-        if not p and not q:
-            return True
-        if p and q and p.data==q.data:
-            return isSameTree(p.left,q.left) and isSameTree(p.right, q.right)
-        else:
-            return False
+        stack = [(p, q)]
+        while stack:
+            a, b = stack.pop()
+            if a is None and b is None:
+                continue
+            if a is None or b is None or a.data!=b.data:
+                return False
+            stack.append((a.right, b.right))
+            stack.append((a.left, b.left))
+        return True
 def insert_data(arr):
     root = TreeNode(arr[0])
     for val in arr[1:]:
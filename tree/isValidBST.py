@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -18,14 +20,20 @@ class TreeNode():
             else:
                 self.right = TreeNode(data)
 
+    # explicit stack of (node, lo, hi): every node has to lie strictly between the bounds its
+    # ancestors set, None meaning no bound on that side
     def isValid(self):
-        def valid(node, left, right):
-            if node.left is None and node.right is None:
-                return True
-            if not (node.data>left and node.data<right):
+        stack = [(self, None, None)]
+        while stack:
+            node, lo, hi = stack.pop()
+            v = node.data
+            if (lo is not None and v<=lo) or (hi is not None and v>=hi):
                 return False
-            return (valid(node.left, left, node.data) and valid(node.right, node.data, right))
-        return valid(self, float('-inf'), float('inf'))
+            if node.left:
+                stack.append((node.left, lo, v))
+            if node.right:
+                stack.append((node.right, v, hi))
+        return True
 
 def insert_data(arr):
     root = TreeNode(arr[0])
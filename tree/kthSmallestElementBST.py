@@ -1,4 +1,8 @@
+from itertools import islice
+
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -18,16 +22,25 @@ class TreeNode():
             else:
                 self.right = TreeNode(data)
 
+    # inorder walk on an explicit stack that yields the values one at a time, so a caller that
+    # stops early never visits the rest; holds at most one stack entry per level
+    def inorder_iter(self):
+        stack = []
+        node = self
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.data
+                node = node.right
+
+# the inorder walk stops as soon as the kth value comes out, nothing after it is visited
 def kThSmallest(root,k) :
-        data = []
-        def dfs(root):
-            if root is None:
-                return
-            dfs(root.left)
-            data.append(root.data)
-            dfs(root.right)
-        dfs(root)
-        return data[k-1]
+        for val in islice(root.inorder_iter(), k-1, k):
+            return val
+        raise IndexError('k is larger than the number of nodes')
 def insert_data(arr):
     root = TreeNode(arr[0])
     for val in arr[1:]:
@@ -1,4 +1,8 @@
+from collections import deque
+
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -17,10 +21,19 @@ class TreeNode():
                 self.right.add_child(data)
             else:
                 self.right = TreeNode(data)
+    # level by level with a queue: every pass of the outer loop empties one level of the tree
     def depth_of_tree(self):
-        left_depth = self.left.depth_of_tree() if self.left else 0
-        right_depth = self.right.depth_of_tree() if self.right else 0
-        return max(left_depth, right_depth) + 1
+        q = deque([self])
+        depth = 0
+        while q:
+            depth += 1
+            for _ in range(len(q)):
+                node = q.popleft()
+                if node.left:
+                    q.append(node.left)
+                if node.right:
+                    q.append(node.right)
+        return depth
         
 
 
@@ -1,4 +1,8 @@
+from array import array
+
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -20,16 +24,39 @@ class TreeNode():
                 self.right = TreeNode(data)
 
     def post_order(self):
-        elements = []
-        #left
-        if self.left:
-            elements += self.left.post_order()
-        #right
-        if self.right:
-            elements += self.right.post_order()
-        elements.append(self.data)
+        # two stacks: popping the first one gives root, right, left, and the second one (elements)
+        # collects that order, read backwards it is left, right, root
+        elements = array('q')
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            elements.append(node.data)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        elements.reverse()
 
         return elements
+
+    # lazy version of post_order. it can not reverse a root, right, left walk, so it goes down the
+    # left side and only yields a node once its right subtree is finished (last is the node
+    # yielded just before)
+    def post_order_iter(self):
+        stack = []
+        node = self
+        last = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and top.right is not last:
+                    node = top.right
+                else:
+                    last = stack.pop()
+                    yield last.data
 def insert_data(arr):
     root = TreeNode(arr[0])
     for val in arr[1:]:
@@ -38,4 +65,4 @@ def insert_data(arr):
 if __name__ == '__main__':
     data = [15,12,20,8,13,17,27,7,9,12,14]
     build_tree = insert_data(data)
-    print(build_tree.post_order())
\ No newline at end of file
+    print(build_tree.post_order().tolist())
\ No newline at end of file
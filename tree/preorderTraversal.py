@@ -1,4 +1,8 @@
+from array import array
+
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.right = None
@@ -19,18 +23,31 @@ class TreeNode():
                 self.right = TreeNode(data)
 
     def preorder(self):
-        elements = []
-
-        #root
-        elements.append(self.data)
-        #left
-        if self.left:
-            elements += self.left.preorder()
-        #right
-        if self.right:
-            elements += self.right.preorder()
+        # explicit stack instead of recursion, everything goes into one output array
+        elements = array('q')
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            #root
+            elements.append(node.data)
+            #right is pushed first so left comes off the stack first
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
         return elements
 
+    # lazy version of preorder
+    def preorder_iter(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
 def insert_data(arr):
     root = TreeNode(arr[0])
     for val in arr[1:]:
@@ -39,4 +56,4 @@ def insert_data(arr):
 if __name__ == '__main__':
     data = [15,12,20,8,13,17,27,7,9,12,14]
     build_tree = insert_data(data)
-    print(build_tree.preorder())
\ No newline at end of file
+    print(build_tree.preorder().tolist())
\ No newline at end of file
@@ -1,4 +1,6 @@
 class TreeNode():
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -18,19 +20,52 @@ class TreeNode():
             else:
                 self.right = TreeNode(data)
 
+# both trees are walked in lockstep from one stack of (p, q) pairs instead of two recursive calls
 def isSameTree(p, q) -> bool:
-        if not p and not q:
-            return True
-        if p and q and p.data==q.data:
-            return isSameTree(p.left,q.left) and isSameTree(p.right, q.right)
-        else:
-            return False
+        stack = [(p, q)]
+        while stack:
+            a, b = stack.pop()
+            if a is None and b is None:
+                continue
+            if a is None or b is None or a.data!=b.data:
+                return False
+            stack.append((a.right, b.right))
+            stack.append((a.left, b.left))
+        return True
+# hash of every subtree, keyed by id(node), filled bottom up by an iterative post-order: a node is
+# pushed once to schedule its children and once more (done=True) to hash itself after them.
+# equal subtrees get equal hashes, so only nodes whose hash matches need the full comparison
+def subtree_hashes(root):
+    hashes = {None: hash(None)}
+    stack = [(root, False)] if root else []
+    while stack:
+        node, done = stack.pop()
+        if done:
+            left = hashes[id(node.left)] if node.left else hashes[None]
+            right = hashes[id(node.right)] if node.right else hashes[None]
+            hashes[id(node)] = hash((node.data, left, right))
+            continue
+        stack.append((node, True))
+        if node.right:
+            stack.append((node.right, False))
+        if node.left:
+            stack.append((node.left, False))
+    return hashes
+
 def is_subtree(root, subroot):
     if not subroot: return True
-    if not root: return False
-    if isSameTree(root, subroot):
-        return True
-    return is_subtree(root.left, subroot) or is_subtree(root.right, subroot)
+    target = subtree_hashes(subroot)[id(subroot)]
+    hashes = subtree_hashes(root)
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        if hashes[id(node)] == target and isSameTree(node, subroot):
+            return True
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+    return False
 def insert_data(arr):
     root = TreeNode(arr[0])
     for val in arr[1:]:
@@ -1,6 +1,9 @@
 class TreeNode:
     def __init__(self):
-        self.children = {}
+        # slot i holds the child for chr(97 + i); any other character goes to the extra dict,
+        # created only when such a character shows up
+        self.children = [None] * 26
+        self.extra = None
         self.is_end_of_word = False
 class WordDictionary:
     def __init__(self):
@@ -9,9 +12,18 @@ class WordDictionary:
     def addWord(self, word: str) -> None:
         node = self.root
         for char in word:
-            if char not in node.children:
-                node.children[char] = TreeNode()
-            node = node.children[char]
+            i = ord(char) - 97
+            if 0 <= i < 26:
+                child = node.children[i]
+                if child is None:
+                    child = node.children[i] = TreeNode()
+            else:
+                if node.extra is None:
+                    node.extra = {}
+                child = node.extra.get(char)
+                if child is None:
+                    child = node.extra[char] = TreeNode()
+            node = child
         node.is_end_of_word = True
 
     def search(self, word: str) -> bool:
@@ -19,14 +31,23 @@ class WordDictionary:
             if i == len(word):
                 return node.is_end_of_word
             if word[i] == '.':
-                for child in node.children.values():
-                    if dfs(child, i + 1):
+                for child in node.children:
+                    if child and dfs(child, i + 1):
                         return True
+                if node.extra:
+                    for child in node.extra.values():
+                        if dfs(child, i + 1):
+                            return True
                 return False
             else:
-                if word[i] not in node.children:
+                c = ord(word[i]) - 97
+                if 0 <= c < 26:
+                    child = node.children[c]
+                else:
+                    child = node.extra.get(word[i]) if node.extra else None
+                if child is None:
                     return False
-                return dfs(node.children[word[i]], i + 1)
+                return dfs(child, i + 1)
         return dfs(self.root, 0)
 
 # Your WordDictionary object will be instantiated and called as such: